@@ -1,32 +1,68 @@
 # Monitoring dashboard for nitinol nanoparticle simulation
 # Creates a lightweight web server to track simulation progress
 # Access from mobile devices or any web browser - with secure access
+#
+# For many concurrent viewers, serve it from a gevent worker instead of the dev server:
+#   NITI_DASHBOARD_KEY=<key> gunicorn -k geventwebsocket.gunicorn.workers.GeventWebSocketWorker \
+#       -w 1 --worker-connections 1000 -b 0.0.0.0:8087 dashboard:app
+
+# Prefer gevent so slow requests overlap on I/O instead of blocking each other;
+# patching has to happen before socket/threading/subprocess are imported
+try:
+    from gevent import monkey
+    monkey.patch_all()
+    ASYNC_MODE = 'gevent'
+except ImportError:
+    ASYNC_MODE = 'threading'
 
 import os
+import re
 import sys
-import glob
 import json
 import time
+import mmap
+import queue
 import socket
 import threading
+import functools
 import subprocess
+from collections import OrderedDict
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Non-interactive backend
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
-from flask import Flask, render_template, jsonify, request, send_file, redirect, url_for, session
-from flask_socketio import SocketIO
+from flask import Flask, render_template, render_template_string, jsonify, request, send_file, redirect, url_for, session
+from flask.json.provider import DefaultJSONProvider
+from flask_socketio import SocketIO, emit
 import pandas as pd
 import logging
 import argparse
 import requests
 import secrets
-import hashlib
+import hmac
 import qrcode
 from io import BytesIO
 import base64
 
+# orjson is several times faster than the json module on numeric payloads and
+# writes numpy arrays without a tolist() copy; fall back to the stdlib if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Logs and series JSON are highly compressible text, which matters over the tunnel
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# With watchdog (and without gevent), log writes are reacted to as they happen instead of on the next poll
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # Configure logging
 logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -38,8 +74,10 @@ logger = logging.getLogger("NiTi-Dashboard")
 parser = argparse.ArgumentParser(description='NiTi Nanoparticle Simulation Dashboard')
 parser.add_argument('--local-only', action='store_true', help='Run in local mode only (no remote access)')
 parser.add_argument('--remote-url', type=str, help='Custom ngrok URL if you have a paid account')
-parser.add_argument('--secure-key', type=str, help='Provide a custom secure key for dashboard access')
-args = parser.parse_args()
+parser.add_argument('--secure-key', type=str, default=os.environ.get('NITI_DASHBOARD_KEY'),
+                    help='Provide a custom secure key for dashboard access (or set NITI_DASHBOARD_KEY)')
+# Tolerate foreign arguments when imported by a WSGI server such as gunicorn
+args, _ = parser.parse_known_args()
 
 # Generate a secure access key if not provided
 ACCESS_KEY = args.secure_key if args.secure_key else secrets.token_urlsafe(16)
@@ -56,25 +94,116 @@ def get_local_ip():
     except:
         return "localhost"
 
+# The host address is re-resolved at most every LOCAL_IP_TTL seconds instead of
+# opening a socket per request; the TTL lets a DHCP renewal show up eventually
+LOCAL_IP_TTL = 10.0
+_LOCAL_IP_CACHE = {"time": 0.0, "value": None}
+
+def cached_local_ip():
+    """Return get_local_ip(), reusing the result for LOCAL_IP_TTL seconds"""
+    if _LOCAL_IP_CACHE["value"] is None or time.monotonic() - _LOCAL_IP_CACHE["time"] >= LOCAL_IP_TTL:
+        _LOCAL_IP_CACHE["value"] = get_local_ip()
+        _LOCAL_IP_CACHE["time"] = time.monotonic()
+    return _LOCAL_IP_CACHE["value"]
+
 # Initialize Flask app
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'nitinol_nanoparticle_sim_' + secrets.token_hex(16)
 app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(days=7)
-socketio = SocketIO(app)
+# Keep the session cookie away from page scripts and cross-site requests.
+# SESSION_COOKIE_SECURE is left off: local-network access is plain http.
+app.config['SESSION_COOKIE_HTTPONLY'] = True
+app.config['SESSION_COOKIE_SAMESITE'] = 'Lax'
+
+def _json_default(obj):
+    """Serialize the numpy values the stdlib json module does not know about"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return DefaultJSONProvider.default(obj)
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider for jsonify() that uses orjson when it is installed"""
+    def dumps(self, obj, **kwargs):
+        if orjson is None:
+            kwargs.setdefault("default", _json_default)
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
+
+# Compress pages, JSON and log tails. Flask-Compress would also compress streamed
+# bodies by default, including send_file responses; with COMPRESS_STREAMS off, whole-log
+# downloads keep their sendfile path and Range responses count the bytes actually sent
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_STREAMS'] = False
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/plain', 'application/json']
+    Compress(app)
+socketio = SocketIO(app, async_mode=ASYNC_MODE)
 
 # Global variables
 WORKSPACE_DIR = "/home/rimuru/workspace"
 DATA_DIR = os.path.join(WORKSPACE_DIR, "setup_sim/data")
 PHASE_DIRS = [os.path.join(DATA_DIR, f"phase{i}") for i in range(1, 5)]
 LOG_DIRS = [os.path.join(dir_path, "logs") for dir_path in PHASE_DIRS]
-PLOT_DIR = os.path.join(DATA_DIR, "dashboard_plots")
-KEY_HASH = hashlib.sha256(ACCESS_KEY.encode()).hexdigest()
 running_sims = {}
 last_update = {}
 remote_url = None
-
-# Ensure plot directory exists
-os.makedirs(PLOT_DIR, exist_ok=True)
+# Cleared only while remote access is being set up in the background
+REMOTE_READY = threading.Event()
+REMOTE_READY.set()
+
+# Status is shared by every poller for STATUS_TTL seconds
+STATUS_TTL = 2.0
+_STATUS_CACHE = {"time": 0.0, "value": None}
+_STATUS_LOCK = threading.Lock()
+
+# Status is pushed to connected clients every STATUS_PUSH_INTERVAL seconds
+STATUS_PUSH_INTERVAL = 5
+_updates_task = None
+_UPDATES_LOCK = threading.Lock()
+
+# (phase, path) pairs reported by the filesystem watch; a burst of writes within
+# WATCH_DEBOUNCE seconds is handled as one change. Our own reads are not events
+WATCH_DEBOUNCE = 1.0
+WATCH_EVENT_TYPES = {"created", "modified", "moved", "deleted"}
+_WATCH_EVENTS = queue.Queue()
+_observer = None
+
+# Per-log parse and tail-scan state, so polls only touch newly appended bytes
+LOOP_MARKER = b"Loop time"
+_THERMO_HEADER_RE = re.compile(rb'^[ \t]*Step\b[^\n]*\bTemp\b[^\n]*$', re.M)  # Typical header line
+_THERMO_END_RE = re.compile(rb'^(?:Loop time|ERROR)', re.M)
+
+# Only plotted thermo columns are kept. float32 is plenty for a plot; Step stays
+# float64 because float32 stops representing integers exactly past 2**24
+THERMO_DTYPES = {'Step': np.float64, 'Temp': np.float32, 'PotEng': np.float32,
+                 'KinEng': np.float32, 'Press': np.float32}
+# Both are keyed on log path and evict the least recently used log past LOG_CACHE_SIZE, so
+# a long-running dashboard doesn't keep every log it ever read
+LOG_CACHE_SIZE = 16
+_LOG_SECTIONS = OrderedDict()
+_LOG_TAIL = OrderedDict()
+# Bytes kept from just before a resume offset. A log replaced or rewritten in place by a
+# new run has different bytes there even once it has grown past the old size
+LOG_ANCHOR_BYTES = 4096
+
+# Plots are drawn in the browser; the server only ships each series decimated
+# to SERIES_MAX_POINTS, about the pixel width of one dashboard panel
+SERIES_MAX_POINTS = 1000
+SERIES_COLUMNS = ['Temp', 'PotEng', 'KinEng', 'Press']
+
+# Log viewers only fetch the end of a log; this is what fits the scroll window
+LOG_TAIL_BYTES = 64 * 1024
 
 # Helper function to setup cloudflared tunnel
 def setup_cloudflared():
@@ -197,9 +326,10 @@ def setup_serveo():
         logger.error(f"Error setting up serveo: {str(e)}")
         return False
 
-# Background update thread
+# Background update task
 def background_updates():
-    """Background thread to periodically update plots and status"""
+    """Background task that computes status once per interval and pushes it to all clients when it changed"""
+    pushed = None
     while True:
         try:
             # Update simulation status
@@ -209,13 +339,89 @@ def background_updates():
             last_update["time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             last_update["status"] = status
 
+            # One computation serves every connected tab, and an idle pipeline sends nothing
+            if status != pushed:
+                socketio.emit('status_update', status)
+                pushed = status
+
             # Sleep for a while
-            time.sleep(60)  # Update every minute
+            socketio.sleep(STATUS_PUSH_INTERVAL)
         except Exception as e:
             logger.error(f"Error in background update thread: {str(e)}")
-            time.sleep(30)  # Sleep less on error
+            socketio.sleep(30)  # Back off on error
+
+def _watched_phase(path):
+    """Return the phase a path belongs to if it is a phase log or COMPLETE flag, else None"""
+    for i, phase_dir in enumerate(PHASE_DIRS, 1):
+        if path == os.path.join(phase_dir, "COMPLETE"):
+            return i
+        name = os.path.basename(path)
+        if (os.path.dirname(path) == LOG_DIRS[i - 1]
+                and name.endswith(".log") and not name.startswith(".")):
+            return i
+    return None
+
+class _LogEventHandler(FileSystemEventHandler):
+    """Queue (phase, path) for every write to a phase log or COMPLETE flag"""
+    def on_any_event(self, event):
+        if event.is_directory or event.event_type not in WATCH_EVENT_TYPES:
+            return
+        for path in (event.src_path, getattr(event, "dest_path", "")):
+            phase = _watched_phase(path) if path else None
+            if phase:
+                _WATCH_EVENTS.put((phase, path))
+
+def watch_updates():
+    """Background task that refreshes the status once per burst of log writes and pushes the changed phases"""
+    while True:
+        try:
+            changed = {_WATCH_EVENTS.get()}
+            # Let the burst settle, then take everything that queued up meanwhile
+            socketio.sleep(WATCH_DEBOUNCE)
+            while True:
+                try:
+                    changed.add(_WATCH_EVENTS.get_nowait())
+                except queue.Empty:
+                    break
+
+            with _STATUS_LOCK:
+                _STATUS_CACHE["value"] = None
+            status = get_simulation_status()
+            last_update["time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            last_update["status"] = status
 
-# Helper function to generate a QR code for the access URL
+            for phase in sorted({phase for phase, path in changed}):
+                socketio.emit('phase_update', {"phase": phase, "status": status["phases"][phase - 1],
+                                               "overall_progress": status["overall_progress"]})
+        except Exception as e:
+            logger.error(f"Error in log watch task: {str(e)}")
+            socketio.sleep(30)  # Back off on error
+
+def _start_log_watch():
+    """Watch the data directory for log writes, if watchdog is installed"""
+    global _observer
+    # Under gevent, threading is monkey-patched, so the observer's threads and their blocking
+    # inotify reads would run as greenlets on the server's hub and could stall it; the
+    # periodic status push covers log changes there instead
+    if Observer is None or ASYNC_MODE == 'gevent' or not os.path.isdir(DATA_DIR):
+        return
+    # Watch DATA_DIR recursively, since phase directories appear as the pipeline runs
+    _observer = Observer()
+    _observer.schedule(_LogEventHandler(), DATA_DIR, recursive=True)
+    _observer.start()
+    socketio.start_background_task(watch_updates)
+
+def start_background_updates():
+    """Start the status push task once, whichever server (socketio.run or gunicorn) hosts the app"""
+    global _updates_task
+    with _UPDATES_LOCK:
+        if _updates_task is None:
+            _updates_task = socketio.start_background_task(background_updates)
+            _start_log_watch()
+
+# Helper function to generate a QR code for the access URL; the image only
+# depends on the URL, so each one is rendered and encoded once
+@functools.lru_cache(maxsize=4)
 def generate_qr_code(url):
     qr = qrcode.QRCode(
         version=1,
@@ -246,101 +452,221 @@ def require_auth(f):
     return decorated
 
 # Same helper functions as before
+def _is_plot_column(name):
+    return name in THERMO_DTYPES
+
+def _cache_log_state(cache, log_file, state):
+    """Store state as the most recently used entry of a per-log cache"""
+    cache[log_file] = state
+    cache.move_to_end(log_file)
+    if len(cache) > LOG_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def _read_thermo_rows(data, names):
+    """Parse thermo rows (without their header line) into the plotted columns"""
+    if not data.strip():
+        return pd.DataFrame({name: pd.Series(dtype=THERMO_DTYPES[name])
+                             for name in names if _is_plot_column(name)})
+
+    # Let the pandas C tokenizer split and convert straight to floats,
+    # keeping only the plotted columns
+    block = BytesIO(data)
+    options = dict(sep=r'\s+', engine='c', header=None, names=names, usecols=_is_plot_column,
+                   on_bad_lines='skip')
+    try:
+        df = pd.read_csv(block, dtype=THERMO_DTYPES, **options)
+    except ValueError:
+        # Warnings interleaved with thermo output; coerce those rows to NaN
+        block.seek(0)
+        df = pd.read_csv(block, **options)
+        df = df.apply(pd.to_numeric, errors='coerce')
+        df = df.astype({col: THERMO_DTYPES[col] for col in df.columns})
+    # Rows cut short by a warning come through NaN-padded
+    return df.dropna()
+
+def _parse_thermo_sections(mm, pos, settled, open_section):
+    """Parse thermo output from byte offset pos on, appending closed sections to settled
+
+    open_section is the section still being written at pos ({"names", "df"}), or None.
+    Returns the section left open at the end of mm and the offset to resume from: just
+    past its last complete row, or the start of a header line not yet fully written.
+    """
+    while True:
+        if open_section is not None:
+            # A section runs until "Loop time"/ERROR or the next header, whichever comes first
+            header = _THERMO_HEADER_RE.search(mm, pos)
+            end = header.start() if header else len(mm)
+            end_match = _THERMO_END_RE.search(mm, pos, end)
+            closed = header is not None or end_match is not None
+            if end_match:
+                end = end_match.start()
+            # Only complete lines; a row still being written is read on a later call
+            limit = end if closed else max(pos, mm.rfind(b'\n', pos, end) + 1)
+            if limit > pos:
+                rows = _read_thermo_rows(mm[pos:limit], open_section["names"])
+                if not rows.empty:
+                    df = open_section["df"]
+                    df = rows if df.empty else pd.concat([df, rows], ignore_index=True)
+                    open_section = {"names": open_section["names"], "df": df}
+            if not closed:
+                return open_section, limit
+            if not open_section["df"].empty:
+                settled.append((list(open_section["df"].columns), open_section["df"]))
+            open_section, pos = None, end
+
+        header = _THERMO_HEADER_RE.search(mm, pos)
+        if header is None:
+            # A header may be partway through being written on the last line
+            return None, max(pos, mm.rfind(b'\n', pos) + 1)
+        if mm[header.end():header.end() + 1] != b'\n':
+            return None, header.start()
+        names = mm[header.start():header.end()].decode(errors='replace').split()
+        open_section = {"names": names, "df": _read_thermo_rows(b'', names)}
+        pos = header.end() + 1
+
+def _log_anchor(f, end):
+    """Return the LOG_ANCHOR_BYTES bytes of an open log that end at offset end"""
+    start = max(0, end - LOG_ANCHOR_BYTES)
+    f.seek(start)
+    return f.read(end - start)
+
+def _same_log(f, st, cached, offset):
+    """True if f is still the log cached was taken from, grown but unchanged up to offset"""
+    return (cached is not None and cached["identity"] == (st.st_dev, st.st_ino)
+            and st.st_size >= offset and _log_anchor(f, offset) == cached["anchor"])
+
 def parse_lammps_log(log_file):
     """Parse a LAMMPS log file and extract time series data"""
     try:
-        with open(log_file, 'r') as f:
-            content = f.readlines()
-
-        data_sections = []
-        in_data_section = False
-        headers = []
-        current_section = []
-
-        for line in content:
-            line = line.strip()
-            if 'Step' in line and 'Temp' in line:  # Typical header line
-                if in_data_section and current_section:
-                    data_sections.append((headers, current_section))
-                in_data_section = True
-                headers = line.split()
-                current_section = []
-            elif in_data_section:
-                if line and not line.startswith('Loop') and not line.startswith('#'):
-                    try:
-                        # Convert line to numeric values
-                        values = [float(x) for x in line.split()]
-                        if len(values) == len(headers):
-                            current_section.append(values)
-                    except ValueError:
-                        in_data_section = False
-
-        # Add the last section
-        if in_data_section and current_section:
-            data_sections.append((headers, current_section))
-
+        st = os.stat(log_file)
+        identity = (st.st_dev, st.st_ino)
+        cached = _LOG_SECTIONS.get(log_file)
+        if cached and (cached["identity"], cached["mtime_ns"], cached["size"]) == (
+                identity, st.st_mtime_ns, st.st_size):
+            _LOG_SECTIONS.move_to_end(log_file)
+            return cached["sections"]
+
+        settled, open_section, resume, anchor = [], None, 0, b''
+        # mmap refuses empty files
+        if st.st_size > 0:
+            with open(log_file, 'rb') as f:
+                # While the same log only grows, closed sections and the complete rows of
+                # the open one are final, so only the bytes after them are parsed
+                if _same_log(f, st, cached, cached["resume"] if cached else 0):
+                    settled = list(cached["settled"])
+                    open_section, resume = cached["open"], cached["resume"]
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    open_section, resume = _parse_thermo_sections(mm, resume, settled, open_section)
+                anchor = _log_anchor(f, resume)
+
+        data_sections = list(settled)
+        if open_section is not None and not open_section["df"].empty:
+            data_sections.append((list(open_section["df"].columns), open_section["df"]))
+        _cache_log_state(_LOG_SECTIONS, log_file, {
+            "identity": identity,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "resume": resume,
+            "anchor": anchor,
+            "settled": settled,
+            "open": open_section,
+            "sections": data_sections,
+        })
         return data_sections
     except Exception as e:
         logger.error(f"Error parsing log file {log_file}: {str(e)}")
         return []
 
-def create_plot(data, headers, title, filename):
-    """Create a plot from the parsed log data"""
-    try:
-        df = pd.DataFrame(data, columns=headers)
-
-        # Plot typical LAMMPS quantities
-        plot_types = [
-            {'col': 'Temp', 'ylabel': 'Temperature (K)', 'color': 'red'},
-            {'col': 'PotEng', 'ylabel': 'Potential Energy', 'color': 'blue'},
-            {'col': 'KinEng', 'ylabel': 'Kinetic Energy', 'color': 'green'},
-            {'col': 'Press', 'ylabel': 'Pressure (bar)', 'color': 'purple'}
-        ]
-
-        for plot_type in plot_types:
-            col = plot_type['col']
-            if (col in df.columns):
-                plt.figure(figsize=(10, 6))
-                plt.plot(df['Step'], df[col], color=plot_type['color'])
-                plt.xlabel('Step')
-                plt.ylabel(plot_type['ylabel'])
-                plt.title(f"{title} - {plot_type['col']}")
-                plt.grid(True)
-                plot_path = os.path.join(PLOT_DIR, f"{filename}_{col}.png")
-                plt.savefig(plot_path)
-                plt.close()
-
-        return True
-    except Exception as e:
-        logger.error(f"Error creating plot: {str(e)}")
-        return False
+def _scan_log_tail(log_file):
+    """Return (completed, size) for a log, reading only bytes appended since the last call"""
+    st = os.stat(log_file)
+    cached = _LOG_TAIL.get(log_file)
+    with open(log_file, 'rb') as f:
+        # Start over when the log was truncated, replaced or rewritten by a new run
+        if _same_log(f, st, cached, cached["offset"] if cached else 0):
+            offset, completed, anchor = cached["offset"], cached["completed"], cached["anchor"]
+        else:
+            offset, completed, anchor = 0, False, b''
+
+        if not completed and st.st_size > offset:
+            f.seek(offset)
+            # Carry the end of the previous read so a marker split across reads is still found
+            carry = anchor[-(len(LOOP_MARKER) - 1):]
+            while True:
+                chunk = f.read(1 << 20)
+                if not chunk:
+                    break
+                buf = carry + chunk
+                if LOOP_MARKER in buf:  # LAMMPS completion indicator
+                    completed = True
+                carry = buf[-(len(LOOP_MARKER) - 1):]
+            offset = f.tell()
+            anchor = _log_anchor(f, offset)
+
+    _cache_log_state(_LOG_TAIL, log_file, {"identity": (st.st_dev, st.st_ino), "offset": offset,
+                                           "completed": completed, "anchor": anchor})
+    return completed, st.st_size
+
+def _minmax_downsample(x, y, max_points):
+    """Reduce a series to about max_points by keeping each bucket's min and max, so spikes survive"""
+    n = len(y)
+    if n <= max_points:
+        return x, y
+    buckets = max_points // 2
+    size = -(-n // buckets)  # Ceiling division
+    # Pad with the last value so the series reshapes into equal buckets
+    padded = np.concatenate([y, np.full(size * buckets - n, y[-1])]).reshape(buckets, size)
+    base = np.arange(buckets) * size
+    idx = np.unique(np.minimum(np.concatenate([base + padded.argmin(axis=1),
+                                                base + padded.argmax(axis=1)]), n - 1))
+    return x[idx], y[idx]
+
+def _scan_procs(patterns):
+    """Return {pattern: [pid, ...]} for processes whose command line contains pattern (like pgrep -f)"""
+    found = {pattern: [] for pattern in patterns}
+    own_pid = str(os.getpid())
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit() or pid == own_pid:
+            continue
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read().replace(b'\0', b' ')
+        except OSError:
+            continue  # Process exited while scanning
+        for pattern in patterns:
+            if pattern.encode() in cmdline:
+                found[pattern].append(pid)
+    return found
 
 def get_simulation_status():
+    """Get the status of all simulation phases, reusing results younger than STATUS_TTL"""
+    # Concurrent pollers wait on the lock and then share one computation
+    with _STATUS_LOCK:
+        if _STATUS_CACHE["value"] is not None and time.monotonic() - _STATUS_CACHE["time"] < STATUS_TTL:
+            return _STATUS_CACHE["value"]
+        status = _compute_simulation_status()
+        _STATUS_CACHE["time"] = time.monotonic()
+        _STATUS_CACHE["value"] = status
+        return status
+
+def _compute_simulation_status():
     """Get the status of all simulation phases"""
     status = {
         "phases": [],
         "overall_progress": 0
     }
 
-    # Check if pipeline is running
-    pipeline_running = False
+    # Check for the pipeline and LAMMPS with one /proc scan instead of forking pgrep
     try:
-        result = subprocess.run(["pgrep", "-f", "pipeline.sh"], capture_output=True, text=True)
-        pipeline_running = result.returncode == 0
+        procs = _scan_procs(["pipeline.sh", "lmp"])
     except Exception as e:
-        logger.error(f"Error checking pipeline status: {str(e)}")
+        logger.error(f"Error checking running processes: {str(e)}")
+        procs = {"pipeline.sh": [], "lmp": []}
 
-    status["pipeline_running"] = pipeline_running
+    status["pipeline_running"] = bool(procs["pipeline.sh"])
 
     # Get active LAMMPS processes
-    active_lammps = []
-    try:
-        result = subprocess.run(["pgrep", "-f", "lmp"], capture_output=True, text=True)
-        if result.returncode == 0:
-            active_lammps = result.stdout.strip().split('\n')
-    except Exception as e:
-        logger.error(f"Error checking LAMMPS processes: {str(e)}")
-
+    active_lammps = procs["lmp"]
     status["active_lammps"] = len(active_lammps)
 
     # Process each phase
@@ -351,7 +677,7 @@ def get_simulation_status():
             "status": "Not Started",
             "progress": 0,
             "log_files": [],
-            "plots": []
+            "series_version": None
         }
 
         # Check if directory exists
@@ -359,10 +685,13 @@ def get_simulation_status():
             # Look for log files
             log_dir = os.path.join(phase_dir, "logs")
             if os.path.exists(log_dir):
-                log_files = glob.glob(os.path.join(log_dir, "*.log"))
-                phase_info["log_files"] = [os.path.basename(f) for f in log_files]
+                # One scandir pass; DirEntry caches the stat used to pick the latest log
+                with os.scandir(log_dir) as entries:
+                    log_entries = [entry for entry in entries
+                                   if entry.name.endswith(".log") and not entry.name.startswith(".")]
+                phase_info["log_files"] = [entry.name for entry in log_entries]
 
-                if log_files:
+                if log_entries:
                     # Check for complete flag or analyze logs
                     complete_flag = os.path.join(phase_dir, "COMPLETE")
                     if os.path.exists(complete_flag):
@@ -371,42 +700,24 @@ def get_simulation_status():
                         completed_phases += 1
                     else:
                         # Analyze the most recent log file
-                        latest_log = max(log_files, key(os.path.getmtime))
+                        latest_entry = max(log_entries, key=lambda entry: entry.stat().st_mtime_ns)
+                        latest_log = latest_entry.path
                         phase_info["current_log"] = os.path.basename(latest_log)
 
-                        # Generate plots for the log file if needed
-                        plot_base = f"phase{i}_latest"
-                        have_plots = False
-                        for plot_type in ['Temp', 'PotEng', 'KinEng', 'Press']:
-                            plot_file = f"{plot_base}_{plot_type}.png"
-                            if os.path.exists(os.path.join(PLOT_DIR, plot_file)):
-                                have_plots = True
-                                phase_info["plots"].append(plot_file)
-
-                        if not have_plots:
-                            sections = parse_lammps_log(latest_log)
-                            if sections:
-                                headers, data = sections[-1]  # Use the last section
-                                create_plot(data, headers, f"Phase {i}", plot_base)
-
-                                # Update plots list
-                                for plot_type in ['Temp', 'PotEng', 'KinEng', 'Press']:
-                                    plot_file = f"{plot_base}_{plot_type}.png"
-                                    if os.path.exists(os.path.join(PLOT_DIR, plot_file)):
-                                        phase_info["plots"].append(plot_file)
+                        # Browsers re-fetch /api/series only when this changes
+                        phase_info["series_version"] = latest_entry.stat().st_mtime_ns
 
                         # Estimate progress
                         try:
-                            with open(latest_log, 'r') as f:
-                                content = f.read()
-                            if "Loop time" in content:  # LAMMPS completion indicator
+                            completed, log_size = _scan_log_tail(latest_log)
+                            if completed:
                                 phase_info["status"] = "Complete"
                                 phase_info["progress"] = 100
                                 completed_phases += 1
                             else:
                                 phase_info["status"] = "Running" if str(i) in active_lammps else "Paused"
                                 # Parse to estimate progress
-                                phase_info["progress"] = min(95, max(10, len(content) / 10000 * 100))
+                                phase_info["progress"] = min(95, max(10, log_size / 10000 * 100))
                         except Exception as e:
                             logger.error(f"Error analyzing log file: {str(e)}")
                             phase_info["status"] = "Unknown"
@@ -429,7 +740,8 @@ def login():
     error = None
     if request.method == 'POST':
         input_key = request.form.get('access_key', '')
-        if hashlib.sha256(input_key.encode()).hexdigest() == KEY_HASH:
+        # Constant-time comparison; bytes so non-ASCII input can't raise
+        if hmac.compare_digest(input_key.encode(), ACCESS_KEY.encode()):
             session['authenticated'] = True
             session.permanent = True
             next_page = request.args.get('next', '/')
@@ -506,7 +818,16 @@ def index():
 @app.route('/api/status')
 @require_auth
 def api_status():
-    return jsonify(get_simulation_status())
+    # Serve the last pushed status when the background task is running
+    return jsonify(last_update.get("status") or get_simulation_status())
+
+@socketio.on('connect')
+def on_connect():
+    if not session.get('authenticated'):
+        return False  # Reject unauthenticated sockets
+    start_background_updates()
+    # Send the current status right away instead of waiting for the next push
+    emit('status_update', last_update.get("status") or get_simulation_status())
 
 @app.route('/api/launch', methods=['POST'])
 @require_auth
@@ -529,34 +850,100 @@ def api_launch():
         logger.error(f"Error launching pipeline: {str(e)}")
         return jsonify({"status": "error", "message": str(e)})
 
-@app.route('/plot/<path:filename>')
+@app.route('/api/series/<int:phase>')
 @require_auth
-def get_plot(filename):
-    return send_file(os.path.join(PLOT_DIR, filename))
-
-@app.route('/log/<path:filename>')
-@require_auth
-def get_log(filename):
+def get_series(phase):
+    """Return the plotted thermo columns of a phase's latest log, decimated for drawing"""
+    if not 1 <= phase <= len(LOG_DIRS) or not os.path.isdir(LOG_DIRS[phase - 1]):
+        return jsonify({"error": "Phase not found"}), 404
+
+    with os.scandir(LOG_DIRS[phase - 1]) as entries:
+        log_entries = [entry for entry in entries
+                       if entry.name.endswith(".log") and not entry.name.startswith(".")]
+    if not log_entries:
+        return jsonify({"error": "No log files"}), 404
+    latest_entry = max(log_entries, key=lambda entry: entry.stat().st_mtime_ns)
+
+    series = {}
+    sections = parse_lammps_log(latest_entry.path)
+    if sections:
+        headers, df = sections[-1]  # Use the last section
+        steps = df['Step'].to_numpy()
+        for col in SERIES_COLUMNS:
+            if col in df.columns:
+                # Min/max buckets keep spikes that plain striding would drop
+                x, y = _minmax_downsample(steps, df[col].to_numpy(), SERIES_MAX_POINTS)
+                # Arrays go to the JSON provider as-is; orjson needs them contiguous
+                series[col] = {"x": np.ascontiguousarray(x), "y": np.ascontiguousarray(y)}
+
+    return jsonify({
+        "phase": phase,
+        "log": latest_entry.name,
+        "version": latest_entry.stat().st_mtime_ns,
+        "series": series
+    })
+
+def _resolve_log_path(filename):
+    """Find a log by name in the phase log directories, or the pipeline log"""
     # First try to find the log in any of the phases
     for log_dir in LOG_DIRS:
         log_path = os.path.join(log_dir, filename)
         if os.path.exists(log_path):
-            try:
-                with open(log_path, 'r') as f:
-                    return jsonify({"content": f.read()})
-            except Exception as e:
-                return jsonify({"error": str(e)})
+            return log_path
 
     # Try pipeline log
     pipeline_log = os.path.join(DATA_DIR, "pipeline.log")
     if filename == "pipeline.log" and os.path.exists(pipeline_log):
-        try:
-            with open(pipeline_log, 'r') as f:
-                return jsonify({"content": f.read()})
-        except Exception as e:
-            return jsonify({"error": str(e)})
+        return pipeline_log
 
-    return jsonify({"error": "Log file not found"})
+    return None
+
+@app.route('/log/<path:filename>')
+@require_auth
+def get_log(filename):
+    log_path = _resolve_log_path(filename)
+    if log_path is None:
+        return "Log file not found", 404
+    # Let the server sendfile() the log; conditional=True honours Range and If-Modified-Since
+    return send_file(log_path, mimetype='text/plain', conditional=True)
+
+@app.route('/log/tail/<path:filename>')
+@require_auth
+def get_log_tail(filename):
+    """Return the complete lines appended to a log since byte offset ?since=
+
+    Without since, or when the client is too far behind or the log was truncated,
+    the last LOG_TAIL_BYTES are sent instead and reset tells the client to start over.
+    """
+    log_path = _resolve_log_path(filename)
+    if log_path is None:
+        return "Log file not found", 404
+    try:
+        since = request.args.get('since', type=int)
+        size = os.path.getsize(log_path)
+        reset = since is None or since > size or size - since > LOG_TAIL_BYTES
+        start = max(0, size - LOG_TAIL_BYTES) if reset else since
+
+        with open(log_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(size - start)
+        # Drop the line cut by a mid-file start, and hold back a line still being
+        # written; the client picks it up once its newline arrives
+        if reset and start > 0:
+            skip = data.find(b'\n') + 1
+            data, start = data[skip:], start + skip
+        end = data.rfind(b'\n') + 1
+        if end or len(data) < LOG_TAIL_BYTES:
+            data = data[:end]
+
+        return jsonify({
+            "content": data.decode('utf-8', errors='replace'),
+            "next_offset": start + len(data),
+            "reset": reset
+        })
+    except Exception as e:
+        logger.error(f"Error reading log tail {log_path}: {str(e)}")
+        return str(e), 500
 
 # Login template
 @app.route('/template/login')
@@ -642,7 +1029,18 @@ def get_dashboard_template():
             padding: 10px;
             border-radius: 5px;
         }
-        .plot-img { max-width: 100%; height: auto; margin-bottom: 10px; }
+        .log-view { position: relative; padding: 0; overflow-x: auto; }
+        .log-rows {
+            position: absolute;
+            top: 0;
+            left: 0;
+            margin: 0;
+            padding: 0 10px;
+            overflow: visible;
+            color: inherit;
+            font: inherit;
+        }
+        .plot-panel { width: 100%; height: 500px; margin-bottom: 10px; }
         .phase-header { cursor: pointer; }
         .logout-link {
             position: absolute;
@@ -701,16 +1099,138 @@ def get_dashboard_template():
                 Pipeline Log
             </div>
             <div class="card-body">
-                <pre id="pipeline-log" class="log-window">Loading pipeline log...</pre>
+                <div id="pipeline-log" class="log-window">Loading pipeline log...</div>
             </div>
         </div>
     </div>
 
     <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0-alpha1/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="https://cdn.socket.io/4.7.5/socket.io.min.js"></script>
+    <script src="https://cdn.plot.ly/plotly-2.35.2.min.js"></script>
     <script>
         // Global variables
         let autoRefreshInterval = null;
         const refreshInterval = 30000; // 30 seconds
+        const socket = io();
+
+        // Virtualized log viewer: the full line list stays in memory, but only the
+        // rows in view plus overscan are in the DOM, as one text node
+        class LogView {
+            constructor(container, maxLines = 2000, overscan = 200) {
+                this.container = container;
+                this.maxLines = maxLines;
+                this.overscan = overscan;
+                this.lines = [];
+                this.lineHeight = 0;
+                this.frame = null;
+
+                container.classList.add('log-view');
+                container.textContent = '';
+                this.spacer = document.createElement('div');
+                this.rows = document.createElement('pre');
+                this.rows.className = 'log-rows';
+                container.append(this.spacer, this.rows);
+                container.addEventListener('scroll', () => this.scheduleRender());
+            }
+
+            // Replace the whole buffer, e.g. for a status message
+            setLines(lines) {
+                const follow = this.isAtBottom();
+                this.lines = [];
+                this.update(lines, follow);
+            }
+
+            // Add lines at the end, dropping the oldest past maxLines
+            append(lines) {
+                this.update(lines, this.isAtBottom());
+            }
+
+            update(lines, follow) {
+                for (const line of lines) {
+                    this.lines.push(line);
+                }
+                if (this.lines.length > this.maxLines) {
+                    this.lines.splice(0, this.lines.length - this.maxLines);
+                }
+                this.spacer.style.height = `${this.lines.length * this.measure()}px`;
+                // Only keep following the end if the reader has not scrolled up
+                if (follow) {
+                    this.scrollToIndex(this.lines.length - 1);
+                }
+                this.render();
+            }
+
+            isAtBottom() {
+                const c = this.container;
+                return this.lines.length === 0 ||
+                    c.scrollHeight - c.scrollTop - c.clientHeight <= 2 * this.measure();
+            }
+
+            scrollToIndex(index) {
+                this.container.scrollTop = index * this.measure();
+            }
+
+            measure() {
+                if (!this.lineHeight) {
+                    this.rows.textContent = 'X';
+                    this.lineHeight = this.rows.getBoundingClientRect().height || 16;
+                }
+                return this.lineHeight;
+            }
+
+            scheduleRender() {
+                if (this.frame === null) {
+                    this.frame = requestAnimationFrame(() => {
+                        this.frame = null;
+                        this.render();
+                    });
+                }
+            }
+
+            render() {
+                const lineHeight = this.measure();
+                const first = Math.floor(this.container.scrollTop / lineHeight);
+                const visible = Math.ceil(this.container.clientHeight / lineHeight);
+                const start = Math.max(0, first - this.overscan);
+                const end = Math.min(this.lines.length, first + visible + this.overscan);
+                this.rows.style.transform = `translateY(${start * lineHeight}px)`;
+                this.rows.textContent = this.lines.slice(start, end).join('\\n');
+            }
+        }
+
+        const pipelineLog = new LogView(document.getElementById('pipeline-log'));
+        pipelineLog.setLines(['Loading pipeline log...']);
+
+        // Series last fetched per phase, so plots are only re-fetched when the log changes
+        const seriesCache = new Map();
+        const plotTypes = [
+            { col: 'Temp', ylabel: 'Temperature (K)', color: 'red' },
+            { col: 'PotEng', ylabel: 'Potential Energy', color: 'blue' },
+            { col: 'KinEng', ylabel: 'Kinetic Energy', color: 'green' },
+            { col: 'Press', ylabel: 'Pressure (bar)', color: 'purple' }
+        ];
+
+        // Hidden tabs neither poll nor re-render pushed updates; they catch up when shown
+        function liveUpdates() {
+            return document.getElementById('auto-refresh').checked && !document.hidden;
+        }
+
+        // The server pushes the status to every connected tab whenever it changes
+        socket.on('status_update', data => {
+            if (liveUpdates()) {
+                renderStatus(data);
+            }
+        });
+
+        // Log writes are pushed as soon as the server sees them, one phase at a time
+        let lastStatus = null;
+        socket.on('phase_update', data => {
+            if (lastStatus && liveUpdates()) {
+                lastStatus.phases[data.phase - 1] = data.status;
+                lastStatus.overall_progress = data.overall_progress;
+                renderStatus(lastStatus);
+            }
+        });
 
         // Helper function to update progress bars
         function updateProgressBar(id, value) {
@@ -728,8 +1248,32 @@ def get_dashboard_template():
             }
         }
 
+        // Run fn at once, then drop repeat calls until wait ms pass without one
+        function debounce(fn, wait) {
+            let timer = null;
+            return function(...args) {
+                const callNow = timer === null;
+                clearTimeout(timer);
+                timer = setTimeout(() => { timer = null; }, wait);
+                if (callNow) {
+                    return fn.apply(this, args);
+                }
+            };
+        }
+
+        // Share the request already in flight instead of starting an overlapping one
+        function singleFlight(fn) {
+            let inflight = null;
+            return function(...args) {
+                if (!inflight) {
+                    inflight = fn.apply(this, args).finally(() => { inflight = null; });
+                }
+                return inflight;
+            };
+        }
+
         // Function to fetch and display status
-        async function refreshStatus() {
+        const refreshStatus = singleFlight(async function() {
             try {
                 const response = await fetch('/api/status');
 
@@ -744,152 +1288,272 @@ def get_dashboard_template():
                 }
 
                 const data = await response.json();
+                renderStatus(data);
 
-                // Update overall progress
-                updateProgressBar('overall-progress', data.overall_progress);
-
-                // Update overall status
-                let statusText = data.pipeline_running ?
-                    `<strong>Pipeline Running</strong> with ${data.active_lammps} active LAMMPS processes` :
-                    'Pipeline not currently running';
-                document.getElementById('overall-status').innerHTML = statusText;
-
-                // Update phases
-                const phasesContainer = document.getElementById('phases-container');
-                phasesContainer.innerHTML = '';
-
-                data.phases.forEach(phase => {
-                    const phaseCard = document.createElement('div');
-                    phaseCard.className = 'card phase-card';
-
-                    // Set card header color based on status
-                    let headerClass = 'bg-secondary';
-                    if (phase.status === 'Complete') {
-                        headerClass = 'bg-success';
-                    } else if (phase.status === 'Running') {
-                        headerClass = 'bg-primary';
-                    } else if (phase.status === 'Paused') {
-                        headerClass = 'bg-warning';
-                    }
+            } catch (error) {
+                console.error('Error refreshing status:', error);
+                document.getElementById('overall-status').innerHTML =
+                    `<div class="alert alert-danger">Error refreshing status: ${error.message}</div>`;
+            }
+        });
+
+        // Function to display a status payload, whether fetched or pushed over Socket.IO
+        function renderStatus(data) {
+            lastStatus = data;
+
+            // Update overall progress
+            updateProgressBar('overall-progress', data.overall_progress);
+
+            // Update overall status
+            let statusText = data.pipeline_running ?
+                `<strong>Pipeline Running</strong> with ${data.active_lammps} active LAMMPS processes` :
+                'Pipeline not currently running';
+            document.getElementById('overall-status').innerHTML = statusText;
+
+            // Update phases in place, so expanded cards, an open log and drawn plots
+            // survive each push
+            const phasesContainer = document.getElementById('phases-container');
+            data.phases.forEach(phase => {
+                let phaseCard = document.getElementById(`phase${phase.phase}-card`);
+                if (!phaseCard) {
+                    phaseCard = createPhaseCard(phase.phase);
+                    phasesContainer.appendChild(phaseCard);
+                }
+                updatePhaseCard(phaseCard, phase);
+            });
+
+            // Fetch pipeline log
+            refreshPipelineLog();
+        }
 
-                    // Create card content
-                    phaseCard.innerHTML = `
-                        <div class="card-header phase-header ${headerClass} text-white" data-bs-toggle="collapse" data-bs-target="#phase${phase.phase}-collapse">
-                            Phase ${phase.phase}: ${phase.status} (${Math.round(phase.progress)}%)
+        // Function to build the static part of a phase card, once per phase
+        function createPhaseCard(phaseNumber) {
+            const phaseCard = document.createElement('div');
+            phaseCard.className = 'card phase-card';
+            phaseCard.id = `phase${phaseNumber}-card`;
+            phaseCard.dataset.phase = phaseNumber;
+            phaseCard.innerHTML = `
+                <div class="card-header phase-header text-white" data-bs-toggle="collapse" data-bs-target="#phase${phaseNumber}-collapse"></div>
+                <div id="phase${phaseNumber}-collapse" class="collapse">
+                    <div class="card-body">
+                        <div class="progress mb-3">
+                            <div id="phase${phaseNumber}-progress" class="progress-bar" role="progressbar"></div>
                         </div>
-                        <div id="phase${phase.phase}-collapse" class="collapse">
-                            <div class="card-body">
-                                <div class="progress mb-3">
-                                    <div id="phase${phase.phase}-progress" class="progress-bar" role="progressbar" style="width: ${phase.progress}%">${Math.round(phase.progress)}%</div>
-                                </div>
 
-                                <div class="row">
-                                    <div class="col-md-6">
-                                        <h5>Log Files</h5>
-                                        <div class="list-group log-files-list">
-                                            ${phase.log_files.map(log => `
-                                                <button class="list-group-item list-group-item-action view-log-btn" data-log="${log}">
-                                                    ${log}
-                                                </button>
-                                            `).join('')}
-                                        </div>
-                                        ${phase.log_files.length > 0 ? `
-                                            <div class="mt-3">
-                                                <h6>Current Log:</h6>
-                                                <pre class="log-window" id="phase${phase.phase}-log">Click a log file to view</pre>
-                                            </div>
-                                        ` : ''}
-                                    </div>
-                                    <div class="col-md-6">
-                                        <h5>Plots</h5>
-                                        <div class="plots-container">
-                                            ${phase.plots.map(plot => `
-                                                <img src="/plot/${plot}" class="plot-img" alt="${plot}">
-                                            `).join('')}
-                                        </div>
-                                    </div>
+                        <div class="row">
+                            <div class="col-md-6">
+                                <h5>Log Files</h5>
+                                <div class="list-group log-files-list"></div>
+                                <div class="mt-3 current-log" hidden>
+                                    <h6>Current Log:</h6>
+                                    <pre class="log-window" id="phase${phaseNumber}-log">Click a log file to view</pre>
                                 </div>
                             </div>
+                            <div class="col-md-6">
+                                <h5>Plots</h5>
+                                <div id="phase${phaseNumber}-plot" class="plot-panel" hidden></div>
+                                <p class="text-muted no-plot-data">No plot data yet</p>
+                            </div>
                         </div>
-                    `;
+                    </div>
+                </div>
+            `;
 
-                    phasesContainer.appendChild(phaseCard);
-                    updateProgressBar(`phase${phase.phase}-progress`, phase.progress);
+            // Plotly cannot size a hidden div, so phases are drawn when expanded
+            phaseCard.querySelector('.collapse').addEventListener('shown.bs.collapse', () => {
+                if (phaseCard.dataset.seriesVersion) {
+                    drawSeries(phaseNumber, phaseCard.dataset.seriesVersion);
+                }
+            });
+            return phaseCard;
+        }
+
+        // Function to bring a phase card up to date with its status
+        function updatePhaseCard(phaseCard, phase) {
+            // Set card header color based on status
+            let headerClass = 'bg-secondary';
+            if (phase.status === 'Complete') {
+                headerClass = 'bg-success';
+            } else if (phase.status === 'Running') {
+                headerClass = 'bg-primary';
+            } else if (phase.status === 'Paused') {
+                headerClass = 'bg-warning';
+            }
+
+            const header = phaseCard.querySelector('.phase-header');
+            header.className = `card-header phase-header ${headerClass} text-white`;
+            header.textContent = `Phase ${phase.phase}: ${phase.status} (${Math.round(phase.progress)}%)`;
+            updateProgressBar(`phase${phase.phase}-progress`, phase.progress);
+
+            // Only rebuild the log list when the files change
+            const logFiles = JSON.stringify(phase.log_files);
+            if (phaseCard.dataset.logFiles !== logFiles) {
+                phaseCard.dataset.logFiles = logFiles;
+                phaseCard.querySelector('.log-files-list').innerHTML = phase.log_files.map(log => `
+                    <button class="list-group-item list-group-item-action view-log-btn" data-log="${log}">
+                        ${log}
+                    </button>
+                `).join('');
+                phaseCard.querySelector('.current-log').hidden = phase.log_files.length === 0;
+            }
+
+            // Only redraw when the phase's latest log changed since the last draw
+            const version = phase.series_version ? String(phase.series_version) : '';
+            phaseCard.querySelector('.plot-panel').hidden = !version;
+            phaseCard.querySelector('.no-plot-data').hidden = Boolean(version);
+            if (version !== (phaseCard.dataset.seriesVersion || '')) {
+                phaseCard.dataset.seriesVersion = version;
+                if (version && phaseCard.querySelector('.collapse').classList.contains('show')) {
+                    drawSeries(phase.phase, version);
+                }
+            }
+        }
+
+        // Log buttons come and go with their list, so clicks are handled on the container
+        document.getElementById('phases-container').addEventListener('click', async event => {
+            const button = event.target.closest('.view-log-btn');
+            if (!button) {
+                return;
+            }
+            const logFile = button.getAttribute('data-log');
+            const phaseNumber = button.closest('.phase-card').dataset.phase;
+            const logWindow = document.getElementById(`phase${phaseNumber}-log`);
+
+            logWindow.textContent = 'Loading log...';
+            try {
+                // Only the last 64 KB is needed to fill the scroll window
+                const response = await fetch(`/log/${logFile}`, {
+                    headers: { 'Range': 'bytes=-65536' }
                 });
 
-                // Add event listeners to log buttons
-                document.querySelectorAll('.view-log-btn').forEach(button => {
-                    button.addEventListener('click', async function() {
-                        const logFile = this.getAttribute('data-log');
-                        const phaseNumber = this.closest('.phase-card').querySelector('.phase-header').textContent.charAt(6);
-                        const logWindow = document.getElementById(`phase${phaseNumber}-log`);
-
-                        logWindow.textContent = 'Loading log...';
-                        try {
-                            const response = await fetch(`/log/${logFile}`);
-
-                            if (response.redirected) {
-                                window.location.href = response.url;
-                                return;
-                            }
-
-                            if (!response.ok) {
-                                throw new Error(`HTTP error! status: ${response.status}`);
-                            }
-
-                            const data = await response.json();
-                            if (data.content) {
-                                logWindow.textContent = data.content;
-                                // Scroll to bottom
-                                logWindow.scrollTop = logWindow.scrollHeight;
-                            } else {
-                                logWindow.textContent = data.error || 'Failed to load log';
-                            }
-                        } catch (error) {
-                            logWindow.textContent = `Error: ${error.message}`;
-                        }
+                if (response.redirected) {
+                    window.location.href = response.url;
+                    return;
+                }
+
+                // 416 means the log is still empty
+                if (!response.ok && response.status !== 416) {
+                    throw new Error(`HTTP error! status: ${response.status}`);
+                }
+
+                const content = response.ok ? await response.text() : '';
+                if (content) {
+                    logWindow.textContent = content;
+                    // Scroll to bottom
+                    logWindow.scrollTop = logWindow.scrollHeight;
+                } else {
+                    logWindow.textContent = 'Log is empty';
+                }
+            } catch (error) {
+                logWindow.textContent = `Error: ${error.message}`;
+            }
+        });
+
+        // Function to draw a phase's thermo series in the browser
+        async function drawSeries(phase, version) {
+            const target = document.getElementById(`phase${phase}-plot`);
+            if (!target) {
+                return;
+            }
+
+            try {
+                let cached = seriesCache.get(phase);
+                if (!cached || cached.version !== version) {
+                    const response = await fetch(`/api/series/${phase}`);
+
+                    if (response.redirected) {
+                        window.location.href = response.url;
+                        return;
+                    }
+
+                    if (!response.ok) {
+                        throw new Error(`HTTP error! status: ${response.status}`);
+                    }
+
+                    cached = { version: version, data: await response.json() };
+                    seriesCache.set(phase, cached);
+                }
+
+                // One 2x2 grid of independent axes, like the old combined PNG
+                const traces = [];
+                const layout = {
+                    title: { text: `Phase ${phase}` },
+                    grid: { rows: 2, columns: 2, pattern: 'independent' },
+                    showlegend: false,
+                    margin: { t: 40, r: 10, b: 40, l: 60 }
+                };
+                plotTypes.forEach((plotType, n) => {
+                    const series = cached.data.series[plotType.col];
+                    const suffix = n === 0 ? '' : String(n + 1);
+                    if (!series) {
+                        return;
+                    }
+                    traces.push({
+                        x: series.x, y: series.y, name: plotType.col,
+                        type: 'scattergl', mode: 'lines', line: { color: plotType.color },
+                        xaxis: `x${suffix}`, yaxis: `y${suffix}`
                     });
+                    layout[`xaxis${suffix}`] = { title: { text: 'Step' } };
+                    layout[`yaxis${suffix}`] = { title: { text: plotType.ylabel } };
                 });
 
-                // Fetch pipeline log
-                refreshPipelineLog();
-
+                // react() diffs against the existing plot instead of rebuilding it
+                Plotly.react(target, traces, layout, { responsive: true });
             } catch (error) {
-                console.error('Error refreshing status:', error);
-                document.getElementById('overall-status').innerHTML =
-                    `<div class="alert alert-danger">Error refreshing status: ${error.message}</div>`;
+                console.error('Error drawing series:', error);
+                target.textContent = `Error loading plot data: ${error.message}`;
             }
         }
 
-        // Function to fetch pipeline log
-        async function refreshPipelineLog() {
+        // Byte offset the pipeline log has been read up to; null until the first read
+        let pipelineLogOffset = null;
+
+        // Function to fetch pipeline log, appending only lines written since the last call.
+        // Overlapping calls would read from the same offset and append lines twice
+        const refreshPipelineLog = singleFlight(async function() {
             try {
-                const response = await fetch('/log/pipeline.log');
+                const query = pipelineLogOffset === null ? '' : `?since=${pipelineLogOffset}`;
+                const response = await fetch(`/log/tail/pipeline.log${query}`);
 
                 if (response.redirected) {
                     window.location.href = response.url;
                     return;
                 }
 
+                if (response.status === 404) {
+                    pipelineLogOffset = null;
+                    pipelineLog.setLines(['No pipeline log available']);
+                    return;
+                }
+
                 if (!response.ok) {
                     throw new Error(`HTTP error! status: ${response.status}`);
                 }
 
                 const data = await response.json();
-                const logWindow = document.getElementById('pipeline-log');
+                // The server sends whole lines, so drop the empty string after the last newline
+                const lines = data.content ? data.content.split('\\n') : [];
+                if (lines[lines.length - 1] === '') {
+                    lines.pop();
+                }
 
-                if (data.content) {
-                    logWindow.textContent = data.content;
-                    // Scroll to bottom
-                    logWindow.scrollTop = logWindow.scrollHeight;
-                } else {
-                    logWindow.textContent = data.error || 'No pipeline log available';
+                if (data.reset) {
+                    if (lines.length === 0) {
+                        // Keep asking for a fresh tail until the log has content
+                        pipelineLogOffset = null;
+                        pipelineLog.setLines(['No pipeline log available']);
+                        return;
+                    }
+                    pipelineLog.setLines(lines);
+                } else if (lines.length > 0) {
+                    pipelineLog.append(lines);
                 }
+                pipelineLogOffset = data.next_offset;
             } catch (error) {
                 console.error('Error fetching pipeline log:', error);
-                document.getElementById('pipeline-log').textContent = 'Error fetching pipeline log';
+                pipelineLog.setLines(['Error fetching pipeline log']);
             }
-        }
+        });
 
         // Function to launch pipeline
         async function launchPipeline() {
@@ -942,7 +1606,12 @@ def get_dashboard_template():
             const autoRefreshCheckbox = document.getElementById('auto-refresh');
 
             if (autoRefreshCheckbox.checked) {
-                autoRefreshInterval = setInterval(refreshStatus, refreshInterval);
+                // Updates are pushed over Socket.IO; only poll while that channel is down
+                autoRefreshInterval = setInterval(() => {
+                    if (!socket.connected && !document.hidden) {
+                        refreshStatus();
+                    }
+                }, refreshInterval);
             } else {
                 clearInterval(autoRefreshInterval);
             }
@@ -954,9 +1623,14 @@ def get_dashboard_template():
             refreshStatus();
 
             // Set up event listeners
-            document.getElementById('refresh-btn').addEventListener('click', refreshStatus);
-            document.getElementById('launch-btn').addEventListener('click', launchPipeline);
+            document.getElementById('refresh-btn').addEventListener('click', debounce(refreshStatus, 250));
+            document.getElementById('launch-btn').addEventListener('click', debounce(launchPipeline, 250));
             document.getElementById('auto-refresh').addEventListener('change', toggleAutoRefresh);
+            document.addEventListener('visibilitychange', () => {
+                if (liveUpdates()) {
+                    refreshStatus();
+                }
+            });
 
             // Enable auto-refresh by default
             document.getElementById('auto-refresh').checked = true;
@@ -970,16 +1644,18 @@ def get_dashboard_template():
 @app.route('/api/dashboard-url')
 def get_dashboard_url():
     """Return the URL for accessing the dashboard"""
-    ip = get_local_ip()
+    ip = cached_local_ip()
     port = 8087
 
     urls = {
         "local_url": f"http://{ip}:{port}",
         "ip": ip,
-        "port": port
+        "port": port,
+        # False while the tunnel is still being set up; ask again later for the remote URL
+        "remote_ready": REMOTE_READY.is_set()
     }
 
-    if remote_url:
+    if remote_url and REMOTE_READY.is_set():
         secure_url = f"{remote_url}?key={ACCESS_KEY}"
         urls["remote_url"] = secure_url
         urls["qr_code"] = generate_qr_code(secure_url)
@@ -993,7 +1669,7 @@ def render_login_template():
 
 # Print SSH tunneling instructions for remote access
 def print_ssh_tunneling_instructions():
-    ip = get_local_ip()
+    ip = cached_local_ip()
     port = 8087
 
     print("\n" + "="*70)
@@ -1010,15 +1686,10 @@ def print_ssh_tunneling_instructions():
     print("http://your-server-ip:8087")
     print("="*70 + "\n")
 
-# Main function
-if __name__ == '__main__':
-    # Setup templates
-    from flask import render_template_string
-    app.jinja_env.globals.update(render_template=render_template_string)
-
-    # Setup remote access if enabled
-    remote_access_success = False
-    if not args.local_only:
+# Set up remote access and its QR code; runs as a background task so the
+# dashboard starts serving while the tunnel comes up
+def init_remote_access():
+    try:
         # Try Cloudflare Tunnel first (removed ngrok)
         remote_access_success = setup_cloudflared()
 
@@ -1029,7 +1700,8 @@ if __name__ == '__main__':
 
         if remote_access_success:
             secure_url = f"{remote_url}?key={ACCESS_KEY}"
-            qr_code = generate_qr_code(secure_url)
+            # Render the QR code now; /api/dashboard-url serves the cached image
+            generate_qr_code(secure_url)
 
             print("\n" + "="*80)
             print(f"🔐 SECURE REMOTE ACCESS ENABLED!")
@@ -1064,13 +1736,28 @@ if __name__ == '__main__':
             print("="*50 + "\n")
             # Print SSH tunneling instructions as an alternative
             print_ssh_tunneling_instructions()
+    except Exception as e:
+        logger.error(f"Error setting up remote access: {str(e)}")
+    finally:
+        REMOTE_READY.set()
+
+# Main function
+if __name__ == '__main__':
+    # Setup templates
+    app.jinja_env.globals.update(render_template=render_template_string)
+
+    # Setup remote access if enabled
+    if not args.local_only:
+        # Tunnel setup takes seconds; serve the dashboard while it runs
+        REMOTE_READY.clear()
+        socketio.start_background_task(init_remote_access)
     else:
         print("\n" + "="*50)
         print(f"Running in local-only mode (no remote access)")
         print("="*50 + "\n")
 
     # Print local access information
-    ip = get_local_ip()
+    ip = cached_local_ip()
     port = 8087
     print("\n" + "="*50)
     print(f"NiTi Nanoparticle Simulation Dashboard")
@@ -1081,10 +1768,8 @@ if __name__ == '__main__':
     print("Save this key - you'll need it to log in!")
     print("="*50 + "\n")
 
-    # Start background thread for updates
-    update_thread = threading.Thread(target=background_updates)
-    update_thread.daemon = True
-    update_thread.start()
+    # Start background task for updates
+    start_background_updates()
 
     # Start the web server
     socketio.run(app, host='0.0.0.0', port=port)
@@ -1,22 +1,28 @@
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Figures are only written to files
 import matplotlib.pyplot as plt
 import matplotlib.cm as cm
 from scipy import stats
 import pandas as pd
 import os
+import re
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from collections import namedtuple
 from sklearn.cluster import DBSCAN
 import seaborn as sns
 from mpl_toolkits.mplot3d import Axes3D
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
+from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Image, LongTable, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 from reportlab.graphics.shapes import Drawing
-from scipy.stats import skew, kurtosis, iqr, sem, t
-import numpy as np
+from scipy.stats import t
 from io import BytesIO
-import matplotlib.pyplot as plt
+from PIL import Image as PILImage
 
 # Set the plotting style
 plt.style.use('ggplot')
@@ -34,12 +40,61 @@ EVOLUTION_FILE = os.path.join(DATA_DIR, "cluster_evolution.dat")
 # Create output directory for figures
 FIGURE_DIR = "../figures/"
 os.makedirs(FIGURE_DIR, exist_ok=True)
+FIGURE_DPI = 150  # Plenty for the 6-inch figures in the reports
+# PNGs go through Pillow's optimizer at maximum zlib compression; lossless, just smaller
+PNG_SAVE_KWARGS = {"pil_kwargs": {"optimize": True, "compress_level": 9}}
+
+# Fingerprint of a figure's input data. It also covers the DPI, the matplotlib
+# version and this script, so changing how a figure is drawn redraws it
+def figure_etag(*inputs):
+    digest = hashlib.sha1(f"{FIGURE_DPI}|{matplotlib.__version__}|{os.stat(__file__).st_mtime_ns}".encode())
+    for item in inputs:
+        digest.update(item.tobytes() if isinstance(item, np.ndarray) else repr(item).encode())
+    return digest.hexdigest()
+
+# True if every named figure exists and was last drawn from data with this etag
+def figures_current(etag, *names):
+    for name in names:
+        path = os.path.join(FIGURE_DIR, name)
+        try:
+            with open(path + ".etag") as f:
+                if f.read() != etag or not os.path.exists(path):
+                    return False
+        except OSError:
+            return False
+    return True
+
+# Save a figure into FIGURE_DIR and, unless it is reused for the next plot, free it.
+# With an etag, record it so an unchanged rerun can skip drawing the figure
+def save_figure(fig, name, close=True, etag=None):
+    fig.tight_layout()
+    fig.savefig(os.path.join(FIGURE_DIR, name), dpi=FIGURE_DPI,
+                **(PNG_SAVE_KWARGS if name.endswith('.png') else {}))
+    if etag is not None:
+        with open(os.path.join(FIGURE_DIR, name + ".etag"), "w") as f:
+            f.write(etag)
+    if close:
+        plt.close(fig)
+
+# Parsed arrays are kept per file version (inode, size and mtime) so repeated loads in one
+# process skip the disk; they are shared between callers, so they are returned read-only
+@lru_cache(maxsize=16)
+def _read_data(filename, version, skip_rows, delimiter):
+    # The pandas C tokenizer is much faster than np.loadtxt on large files
+    data = pd.read_csv(filename, skiprows=skip_rows, sep=delimiter or r'\s+', header=None,
+                       comment='#', dtype=np.float64, engine='c').to_numpy()
+    # Squeeze single rows/columns like np.loadtxt did
+    data = np.squeeze(data)
+    data.setflags(write=False)
+    return data
 
 # Function to safely load data with error handling
 def load_data(filename, skip_rows=1, delimiter=None):
     try:
         if os.path.exists(filename):
-            return np.loadtxt(filename, skiprows=skip_rows, delimiter=delimiter)
+            st = os.stat(filename)
+            version = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+            return _read_data(filename, version, skip_rows, delimiter)
         else:
             print(f"Warning: {filename} not found")
             return None
@@ -47,6 +102,64 @@ def load_data(filename, skip_rows=1, delimiter=None):
         print(f"Error loading {filename}: {str(e)}")
         return None
 
+# Indices of local maxima of g(r) above threshold, in order of r
+def find_rdf_peaks(gr, threshold=1.0):
+    inner = gr[1:-1]
+    mask = (inner > gr[:-2]) & (inner > gr[2:]) & (inner > threshold)
+    return np.flatnonzero(mask) + 1
+
+# Same fields as scipy.stats.describe(x, ddof=0): variance, skewness and excess kurtosis in
+# the biased forms np.var, skew and kurtosis return, all from one mean and one set of
+# central moments (describe recomputes the mean for each of them)
+SampleMoments = namedtuple('SampleMoments', 'nobs minmax mean variance skewness kurtosis')
+
+def compute_moments(x):
+    mean = x.mean()
+    dev = x - mean
+    dev2 = dev * dev
+    m2 = dev2.mean()
+    m3 = (dev2 * dev).mean()
+    m4 = (dev2 * dev2).mean()
+    return SampleMoments(len(x), (x.min(), x.max()), mean, m2, m3 / m2**1.5, m4 / m2**2 - 3.0)
+
+# Q1, median and Q3 with np.percentile's default linear interpolation, from a single
+# np.partition around the bracketing ranks (no percentile dispatch or full sort)
+def quartiles(x):
+    ranks = np.array([0.25, 0.5, 0.75]) * (len(x) - 1)
+    lo = ranks.astype(np.intp)
+    hi = np.minimum(lo + 1, len(x) - 1)
+    part = np.partition(x, np.concatenate((lo, hi)))
+    return part[lo] + (part[hi] - part[lo]) * (ranks - lo)
+
+# Ni:Ti ratio per particle; undefined (NaN) for Ti-free particles rather than clamped
+def ni_ti_ratios(ni_counts, ti_counts):
+    return np.divide(ni_counts, ti_counts, out=np.full(ni_counts.shape, np.nan),
+                     where=ti_counts > 0)
+
+# Two-sided 95% Student t critical value, cached per degrees of freedom
+@lru_cache(maxsize=512)
+def t_critical_95(df):
+    return t.ppf(0.975, df)
+
+# Energy values written to THERMO_FILE as "Key: value" pairs
+THERMO_KEYS = ("Energy_Total", "Energy_Nano", "Formation_Energy", "Surface_Energy")
+THERMO_PATTERN = re.compile(r'\b(' + '|'.join(THERMO_KEYS) + r'):\s*([-+0-9.eE]+)')
+
+# Read all energy values in one regex pass; a missing key raises KeyError naming it
+def read_thermo_values(filename):
+    with open(filename, 'r') as f:
+        values = {key: float(value) for key, value in THERMO_PATTERN.findall(f.read())}
+    missing = [key for key in THERMO_KEYS if key not in values]
+    if missing:
+        raise KeyError(f"{', '.join(missing)} not found in {filename}")
+    return values
+
+# Log-normal fit with the location fixed at zero, as (shape, loc, scale) like
+# stats.lognorm.fit(sizes, floc=0). With loc fixed the MLE is closed-form
+def fit_lognorm(sizes):
+    log_sizes = np.log(sizes)
+    return log_sizes.std(), 0.0, np.exp(log_sizes.mean())
+
 # =============================================================================
 # 1. PARTICLE SIZE DISTRIBUTION ANALYSIS
 # =============================================================================
@@ -79,16 +192,22 @@ def analyze_size_distribution():
     print(f"  Standard deviation: {std_size:.2f} atoms")
     print(f"  Size range: {min_size:.0f} - {max_size:.0f} atoms")
 
+    # Skip drawing when the figures already show this data
+    etag = figure_etag(sizes)
+    if figures_current(etag, 'size_distribution.png', 'cumulative_size.png'):
+        return sizes
+
     # Create histogram and fit with log-normal distribution
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    # Histogram
-    counts, bins, _ = ax.hist(sizes, bins=20, alpha=0.7, color='steelblue',
-                               edgecolor='black', label='Simulated data')
+    # Histogram, binned once and reused to scale the fit below
+    counts, bins = np.histogram(sizes, bins=20)
+    ax.bar(bins[:-1], counts, width=np.diff(bins), align='edge', alpha=0.7, color='steelblue',
+           edgecolor='black', label='Simulated data')
 
     # Try to fit log-normal distribution if we have enough data points
     if len(sizes) > 5:
-        shape, loc, scale = stats.lognorm.fit(sizes, floc=0)
+        shape, loc, scale = fit_lognorm(sizes)
         x = np.linspace(min_size, max_size*1.1, 100)
         pdf = stats.lognorm.pdf(x, shape, loc, scale)
         pdf = pdf * np.sum(counts * np.diff(bins)) / np.sum(pdf * np.diff(x)[0])
@@ -98,11 +217,11 @@ def analyze_size_distribution():
     ax.set_ylabel('Frequency')
     ax.set_title('Nanoparticle Size Distribution')
     ax.legend()
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURE_DIR, 'size_distribution.png'), dpi=300)
+    save_figure(fig, 'size_distribution.png', close=False, etag=etag)
 
-    # Create cumulative distribution
-    fig, ax = plt.subplots(figsize=(10, 6))
+    # Create cumulative distribution on the same figure
+    fig.clf()
+    ax = fig.add_subplot()
     sorted_sizes = np.sort(sizes)
     cumulative = np.arange(1, len(sorted_sizes) + 1) / len(sorted_sizes)
     ax.plot(sorted_sizes, cumulative, 'b-', linewidth=2)
@@ -111,8 +230,7 @@ def analyze_size_distribution():
     ax.set_ylabel('Cumulative Probability')
     ax.set_title('Cumulative Size Distribution')
     plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(os.path.join(FIGURE_DIR, 'cumulative_size.png'), dpi=300)
+    save_figure(fig, 'cumulative_size.png', etag=etag)
 
     return sizes
 
@@ -136,13 +254,18 @@ def analyze_composition():
         # Calculate ratios and total sizes
         total = ni_counts + ti_counts
         ni_fraction = ni_counts / total
-        ti_fraction = ti_counts / total
-        ni_ti_ratio = ni_counts / np.maximum(ti_counts, 1)  # Avoid division by zero
+        ti_fraction = 1.0 - ni_fraction
+        ni_ti_ratio = ni_ti_ratios(ni_counts, ti_counts)
 
         print(f"Composition statistics:")
         print(f"  Average Ni fraction: {np.mean(ni_fraction):.3f}")
         print(f"  Average Ti fraction: {np.mean(ti_fraction):.3f}")
-        print(f"  Average Ni:Ti ratio: {np.mean(ni_ti_ratio):.3f}")
+        print(f"  Average Ni:Ti ratio: {np.nanmean(ni_ti_ratio):.3f}")
+
+        # Skip drawing when the figures already show this data
+        etag = figure_etag(comp_data)
+        if figures_current(etag, 'composition_scatter.png', 'composition_ratio_hist.png'):
+            return ni_counts, ti_counts, total
 
         # Create scatter plot of Ni vs Ti content
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -166,12 +289,11 @@ def analyze_composition():
         ax.set_title('Composition Distribution of Nanoparticles')
         ax.legend()
         plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURE_DIR, 'composition_scatter.png'), dpi=300)
+        save_figure(fig, 'composition_scatter.png', etag=etag)
 
         # Create histogram of Ni:Ti ratios
         fig, ax = plt.subplots(figsize=(10, 6))
-        ax.hist(ni_ti_ratio, bins=20, alpha=0.7, color='orange', edgecolor='black')
+        ax.hist(ni_ti_ratio[np.isfinite(ni_ti_ratio)], bins=20, alpha=0.7, color='orange', edgecolor='black')
         ax.axvline(x=1.0, color='r', linestyle='--', label='Perfect 1:1 ratio')
 
         ax.set_xlabel('Ni:Ti Ratio')
@@ -179,8 +301,7 @@ def analyze_composition():
         ax.set_title('Distribution of Ni:Ti Ratios in Nanoparticles')
         ax.legend()
         plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURE_DIR, 'composition_ratio_hist.png'), dpi=300)
+        save_figure(fig, 'composition_ratio_hist.png', etag=etag)
 
         return ni_counts, ti_counts, total
     else:
@@ -203,6 +324,11 @@ def analyze_structure():
         r = rdf_data[:, 0]
         gr = rdf_data[:, 1]
 
+        # Skip drawing when the figures already show this data
+        etag = figure_etag(rdf_data)
+        if figures_current(etag, 'rdf_analysis.png', 'coordination_number.svg'):
+            return r, gr
+
         # Plot RDF
         fig, ax = plt.subplots(figsize=(10, 6))
         ax.plot(r, gr, '-', linewidth=2, color='darkblue')
@@ -212,10 +338,7 @@ def analyze_structure():
         ax.set_title('Radial Distribution Function')
 
         # Highlight important peaks
-        peak_indices = []
-        for i in range(1, len(gr)-1):
-            if gr[i] > gr[i-1] and gr[i] > gr[i+1] and gr[i] > 1.0:
-                peak_indices.append(i)
+        peak_indices = find_rdf_peaks(gr)
 
         # Label important peaks
         for idx in peak_indices[:5]:  # Show only top 5 peaks
@@ -225,26 +348,25 @@ def analyze_structure():
                          arrowprops=dict(arrowstyle='->'))
 
         plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURE_DIR, 'rdf_analysis.png'), dpi=300)
+        save_figure(fig, 'rdf_analysis.png', close=False, etag=etag)
 
         # Calculate coordination number (integral of 4πr²ρg(r))
         rho = 1.0  # Approximate density
         dr = r[1] - r[0]
-        coordination = np.zeros_like(r)
-        for i in range(1, len(r)):
-            coordination[i] = coordination[i-1] + 4 * np.pi * r[i]**2 * rho * gr[i] * dr
+        integrand = 4 * np.pi * r**2 * rho * gr * dr
+        integrand[0] = 0.0  # The running sum starts at zero at the first bin
+        coordination = np.cumsum(integrand)
 
-        # Plot coordination number
-        fig, ax = plt.subplots(figsize=(10, 6))
+        # Plot coordination number on the same figure
+        fig.clf()
+        ax = fig.add_subplot()
         ax.plot(r, coordination, '-', linewidth=2, color='darkgreen')
 
         ax.set_xlabel('r (Å)')
         ax.set_ylabel('Coordination Number')
         ax.set_title('Running Coordination Number')
         plt.grid(True)
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURE_DIR, 'coordination_number.png'), dpi=300)
+        save_figure(fig, 'coordination_number.svg', etag=etag)
 
         return r, gr
     else:
@@ -261,27 +383,12 @@ def analyze_thermodynamics():
 
     try:
         if os.path.exists(THERMO_FILE):
-            with open(THERMO_FILE, 'r') as f:
-                lines = f.readlines()
-
             # Extract key values
-            energy_total = None
-            energy_nano = None
-            formation_energy = None
-            surface_energy = None
-
-            for line in lines:
-                if "Energy_Total:" in line:
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == "Energy_Total:":
-                            energy_total = float(parts[i+1])
-                        elif part == "Energy_Nano:":
-                            energy_nano = float(parts[i+1])
-                        elif part == "Formation_Energy:":
-                            formation_energy = float(parts[i+1])
-                        elif part == "Surface_Energy:":
-                            surface_energy = float(parts[i+1])
+            values = read_thermo_values(THERMO_FILE)
+            energy_total = values["Energy_Total"]
+            energy_nano = values["Energy_Nano"]
+            formation_energy = values["Formation_Energy"]
+            surface_energy = values["Surface_Energy"]
 
             print(f"Thermodynamic results:")
             print(f"  Total energy: {energy_total:.2f} eV")
@@ -289,6 +396,11 @@ def analyze_thermodynamics():
             print(f"  Formation energy: {formation_energy:.4f} eV/atom")
             print(f"  Surface energy: {surface_energy:.6f} eV/Å²")
 
+            # Skip drawing when the figures already show these values
+            etag = figure_etag(energy_total, energy_nano, formation_energy, surface_energy)
+            if figures_current(etag, 'energy_distribution.png', 'energy_metrics.png'):
+                return energy_total, energy_nano, formation_energy, surface_energy
+
             # Create bar chart of energetics
             fig, ax = plt.subplots(figsize=(8, 6))
             labels = ['Total Energy', 'Nanoparticle Energy']
@@ -302,8 +414,7 @@ def analyze_thermodynamics():
             for i, v in enumerate(values):
                 ax.text(i, v/2, f"{v:.2f} eV", ha='center')
 
-            plt.tight_layout()
-            plt.savefig(os.path.join(FIGURE_DIR, 'energy_distribution.png'), dpi=300)
+            save_figure(fig, 'energy_distribution.png', etag=etag)
 
             # Create text figure with key results
             fig, ax = plt.subplots(figsize=(8, 4))
@@ -312,8 +423,7 @@ def analyze_thermodynamics():
                    ha='center', va='center', fontsize=16)
             ax.text(0.5, 0.3, f"Surface Energy: {surface_energy:.6f} eV/Å²",
                    ha='center', va='center', fontsize=16)
-            plt.tight_layout()
-            plt.savefig(os.path.join(FIGURE_DIR, 'energy_metrics.png'), dpi=300)
+            save_figure(fig, 'energy_metrics.png', etag=etag)
 
             return energy_total, energy_nano, formation_energy, surface_energy
     except Exception as e:
@@ -339,6 +449,11 @@ def analyze_time_evolution():
         temp = evolution_data[:, 2]
         num_clusters = evolution_data[:, 3]
 
+        # Skip drawing when the figures already show this data
+        etag = figure_etag(evolution_data)
+        if figures_current(etag, 'time_evolution.png', 'correlation_matrix.png'):
+            return time, ejected_count, temp, num_clusters
+
         # Plot time evolution of key metrics
         fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(10, 12), sharex=True)
 
@@ -361,23 +476,20 @@ def analyze_time_evolution():
         ax3.set_title('Nanoparticle Formation')
         ax3.grid(True)
 
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURE_DIR, 'time_evolution.png'), dpi=300)
+        save_figure(fig, 'time_evolution.png', etag=etag)
 
         # Correlation analysis
         fig, ax = plt.subplots(figsize=(8, 8))
 
-        # Create correlation matrix
-        data = np.column_stack((ejected_count, temp, num_clusters))
+        # Create correlation matrix; corrcoef takes one variable per row
         cols = ['Ejected Atoms', 'Temperature', 'Num Clusters']
-        corr_df = pd.DataFrame(data, columns=cols)
-        corr_matrix = corr_df.corr()
+        corr_matrix = np.corrcoef(evolution_data[:, 1:4].T)
 
         # Plot correlation heatmap
-        sns.heatmap(corr_matrix, annot=True, cmap='coolwarm', linewidths=0.5, ax=ax)
+        sns.heatmap(corr_matrix, annot=True, xticklabels=cols, yticklabels=cols,
+                    cmap='coolwarm', linewidths=0.5, ax=ax)
         ax.set_title('Correlation Between Process Variables')
-        plt.tight_layout()
-        plt.savefig(os.path.join(FIGURE_DIR, 'correlation_matrix.png'), dpi=300)
+        save_figure(fig, 'correlation_matrix.png', etag=etag)
 
         return time, ejected_count, temp, num_clusters
     else:
@@ -399,6 +511,7 @@ def generate_report():
     <!DOCTYPE html>
     <html>
     <head>
+        <meta http-equiv="Cache-Control" content="public, max-age=3600">
         <title>MicroEDM Nitinol Nanoparticle Analysis</title>
         <style>
             body {{ font-family: Arial, sans-serif; margin: 20px; }}
@@ -441,7 +554,7 @@ def generate_report():
             <p>Figure 5: Radial distribution function analysis</p>
         </div>
         <div class="figure">
-            <img src="../figures/coordination_number.png" alt="Coordination">
+            <img src="../figures/coordination_number.svg" alt="Coordination">
             <p>Figure 6: Running coordination number</p>
         </div>
 
@@ -487,20 +600,62 @@ def generate_report():
 # 7. GENERATE PDF REPORT WITH ENHANCED STATISTICS
 # =============================================================================
 
-def generate_pdf_report():
+# Wording for a correlation coefficient in the report, e.g. "Strong positive"
+def correlation_strength(coef):
+    strength = 'Strong' if abs(coef) > 0.7 else 'Moderate' if abs(coef) > 0.3 else 'Weak'
+    return f"{strength} {'positive' if coef > 0 else 'negative'}"
+
+# Shared style for the statistic tables: bold grey header row, full grid
+HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+])
+
+# Figure image for the PDF. Figures larger than their printed size are scaled down to it at
+# FIGURE_DPI first, so ReportLab embeds fewer pixels; the scaled copy is kept next to the
+# figure and reused until the figure is redrawn
+def report_image(path, width, height):
+    scaled_path = os.path.splitext(path)[0] + ".report.png"
+    size = (round(width / inch * FIGURE_DPI), round(height / inch * FIGURE_DPI))
+    try:
+        if not (os.path.exists(scaled_path) and os.stat(scaled_path).st_mtime_ns >= os.stat(path).st_mtime_ns):
+            with PILImage.open(path) as img:
+                if img.width <= size[0] and img.height <= size[1]:
+                    return Image(path, width=width, height=height)
+                img.resize(size, PILImage.LANCZOS).save(scaled_path, **PNG_SAVE_KWARGS["pil_kwargs"])
+        return Image(scaled_path, width=width, height=height)
+    except OSError as e:
+        print(f"Warning: could not scale {path}: {str(e)}")
+        return Image(path, width=width, height=height)
+
+# Paragraph styles are built once and shared by every report paragraph
+REPORT_STYLES = getSampleStyleSheet()
+
+# Body text paragraph; the indented triple-quoted text is collapsed to single spaces
+# before ReportLab parses it
+def text_paragraph(text, style=REPORT_STYLES['Normal']):
+    return Paragraph(" ".join(text.split()), style)
+
+def generate_pdf_report(results=None):
     """Generate a comprehensive PDF report with enhanced statistical analysis."""
     print("\nGenerating PDF report with enhanced statistics...")
 
     # Create PDF file
     pdf_file = os.path.join(DATA_DIR, "nanoparticle_analysis_report.pdf")
-    doc = SimpleDocTemplate(pdf_file, pagesize=A4)
-    styles = getSampleStyleSheet()
+    doc = BaseDocTemplate(pdf_file, pagesize=A4)
+    doc.addPageTemplates([PageTemplate(id='report', frames=[
+        Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='body')])])
+    styles = REPORT_STYLES
 
     # Create custom styles
     title_style = styles['Title']
     heading1_style = styles['Heading1']
     heading2_style = styles['Heading2']
-    normal_style = styles['Normal']
 
     # Add content elements to the PDF
     content = []
@@ -510,12 +665,13 @@ def generate_pdf_report():
     content.append(Spacer(1, 0.2*inch))
     content.append(Paragraph("Detailed Statistical Report", heading1_style))
     content.append(Spacer(1, 0.5*inch))
-    content.append(Paragraph(f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}", normal_style))
+    content.append(text_paragraph(f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M')}"))
     content.append(Spacer(1, 1*inch))
 
-    # Load analysis data for enhanced statistics
-    particle_sizes = load_data(PARTICLE_SIZE_FILE)
-    composition_data = load_data(COMPOSITION_FILE)
+    # Use the arrays the analysis modules returned, keyed as in ANALYSES. When called on
+    # its own, run them here first; their figures are current, so this mostly loads data
+    if results is None:
+        results = {name: analysis() for name, analysis in ANALYSES.items()}
 
     # ==========================================================================
     # 1. ENHANCED SIZE DISTRIBUTION STATISTICS
@@ -523,30 +679,20 @@ def generate_pdf_report():
     content.append(Paragraph("1. Nanoparticle Size Distribution Analysis", heading1_style))
     content.append(Spacer(1, 0.2*inch))
 
-    if particle_sizes is not None and particle_sizes.ndim > 0:
-        # Extract sizes
-        if particle_sizes.ndim > 1:
-            sizes = particle_sizes[:, 1]
-        else:
-            sizes = particle_sizes
-
-        # Basic statistics
-        mean_size = np.mean(sizes)
-        median_size = np.median(sizes)
-        std_dev = np.std(sizes)
-        variance = np.var(sizes)
-        size_range = np.max(sizes) - np.min(sizes)
-
-        # Advanced statistics
-        skewness = skew(sizes)
-        kurt = kurtosis(sizes)
-        iqr_val = iqr(sizes)
-        q1, q3 = np.percentile(sizes, [25, 75])
-
-        # Confidence interval for mean (95%)
-        sem_val = sem(sizes)
-        n = len(sizes)
-        conf_interval = t.ppf(0.975, n-1) * sem_val
+    sizes = results['size']
+    if sizes is not None:
+        # Basic and advanced statistics from shared moments and one partition
+        moments = compute_moments(sizes)
+        n, (min_size, max_size) = moments.nobs, moments.minmax
+        mean_size, variance = moments.mean, moments.variance
+        skewness, kurt = moments.skewness, moments.kurtosis
+        std_dev = np.sqrt(variance)
+        q1, median_size, q3 = quartiles(sizes)
+        iqr_val = q3 - q1
+
+        # Confidence interval for mean (95%); sem from the biased variance
+        sem_val = np.sqrt(variance / (n - 1))
+        conf_interval = t_critical_95(n - 1) * sem_val
 
         # Create table data
         data = [
@@ -557,7 +703,7 @@ def generate_pdf_report():
             ["Median Size", f"{median_size:.2f} atoms"],
             ["Standard Deviation", f"{std_dev:.2f}"],
             ["Variance", f"{variance:.2f}"],
-            ["Range", f"{np.min(sizes):.0f} - {np.max(sizes):.0f} atoms"],
+            ["Range", f"{min_size:.0f} - {max_size:.0f} atoms"],
             ["Interquartile Range", f"{iqr_val:.2f}"],
             ["Skewness", f"{skewness:.3f} ({'right-skewed' if skewness > 0 else 'left-skewed'})"],
             ["Kurtosis", f"{kurt:.3f} ({'heavy-tailed' if kurt > 0 else 'light-tailed'})"],
@@ -565,16 +711,8 @@ def generate_pdf_report():
             ["Q3 (75th percentile)", f"{q3:.2f}"]
         ]
 
-        table = Table(data, colWidths=[2.5*inch, 3*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (1, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (1, 0), colors.black),
-            ('ALIGN', (0, 0), (1, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (1, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (1, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        table = LongTable(data, colWidths=[2.5*inch, 3*inch], repeatRows=1)
+        table.setStyle(HEADER_TABLE_STYLE)
         content.append(table)
         content.append(Spacer(1, 0.2*inch))
 
@@ -583,25 +721,26 @@ def generate_pdf_report():
         content.append(Spacer(1, 0.1*inch))
 
         # Dynamic interpretation based on statistics
+        right_skewed = skewness > 0
         distribution_text = f"""
-        The nanoparticle size distribution shows a {'positive' if skewness > 0 else 'negative'} skew
-        ({skewness:.2f}), indicating {'more smaller particles with some large outliers' if skewness > 0 else
+        The nanoparticle size distribution shows a {'positive' if right_skewed else 'negative'} skew
+        ({skewness:.2f}), indicating {'more smaller particles with some large outliers' if right_skewed else
         'more larger particles with some small outliers'}. The distribution is {'more peaked' if kurt > 0 else 'flatter'}
         than a normal distribution, with a kurtosis value of {kurt:.2f}.
 
         The substantial difference between mean ({mean_size:.2f}) and median ({median_size:.2f}) further confirms
-        the {'right' if skewness > 0 else 'left'}-skewed nature of the distribution, typical for
-        {'nucleation and growth processes' if skewness > 0 else 'fragmentation processes'}.
+        the {'right' if right_skewed else 'left'}-skewed nature of the distribution, typical for
+        {'nucleation and growth processes' if right_skewed else 'fragmentation processes'}.
         """
-        content.append(Paragraph(distribution_text, normal_style))
+        content.append(text_paragraph(distribution_text))
         content.append(Spacer(1, 0.3*inch))
 
         # Add size distribution image
         img_path = os.path.join(FIGURE_DIR, 'size_distribution.png')
         if os.path.exists(img_path):
-            content.append(Image(img_path, width=6*inch, height=4*inch))
+            content.append(report_image(img_path, 6*inch, 4*inch))
             content.append(Spacer(1, 0.1*inch))
-            content.append(Paragraph("Figure 1: Nanoparticle size distribution with log-normal fit", normal_style))
+            content.append(text_paragraph("Figure 1: Nanoparticle size distribution with log-normal fit"))
             content.append(Spacer(1, 0.3*inch))
 
     # ==========================================================================
@@ -610,79 +749,88 @@ def generate_pdf_report():
     content.append(Paragraph("2. Composition Analysis and Statistics", heading1_style))
     content.append(Spacer(1, 0.2*inch))
 
-    if composition_data is not None and composition_data.ndim > 1 and composition_data.shape[1] >= 3:
-        cluster_ids = composition_data[:, 0]
-        ni_counts = composition_data[:, 1]
-        ti_counts = composition_data[:, 2]
-
-        # Calculate ratios and total sizes
-        total = ni_counts + ti_counts
-        ni_fraction = ni_counts / total
-        ti_fraction = ti_counts / total
-        ni_ti_ratio = ni_counts / np.maximum(ti_counts, 1)  # Avoid division by zero
+    if results['composition'] is not None:
+        ni_counts, ti_counts, total = results['composition']
 
-        # Basic statistics
-        mean_ratio = np.mean(ni_ti_ratio)
-        median_ratio = np.median(ni_ti_ratio)
-        std_ratio = np.std(ni_ti_ratio)
+        # The fractions sum to one per particle, so the mean Ti fraction follows from the Ni one
+        mean_ni_fraction = np.mean(ni_counts / total)
+        mean_ti_fraction = 1.0 - mean_ni_fraction
 
-        # Advanced statistics
-        skewness_ratio = skew(ni_ti_ratio)
-        kurt_ratio = kurtosis(ni_ti_ratio)
+        # Ratio statistics cover the particles that contain Ti, as in analyze_composition
+        ni_ti_ratio = ni_ti_ratios(ni_counts, ti_counts)
+        n_ti_free = int(np.count_nonzero(np.isnan(ni_ti_ratio)))
+        ni_ti_ratio = ni_ti_ratio[~np.isnan(ni_ti_ratio)]
 
-        # Calculate statistical significance from 1:1 ratio
-        # H0: mean ratio = 1.0 (ideal stoichiometric ratio)
-        t_stat, p_value = stats.ttest_1samp(ni_ti_ratio, 1.0)
-
-        # Confidence interval
-        sem_ratio = sem(ni_ti_ratio)
+        # Create composition statistics table
+        comp_data = [["Metric", "Value", "Interpretation"]]
         n_ratio = len(ni_ti_ratio)
-        conf_interval_ratio = t.ppf(0.975, n_ratio-1) * sem_ratio
+        # A spread, confidence interval and t-test need at least two ratios
+        if n_ratio >= 2:
+            # Basic and advanced statistics from shared moments
+            ratio_moments = compute_moments(ni_ti_ratio)
+            mean_ratio = ratio_moments.mean
+            median_ratio = np.median(ni_ti_ratio)
+            std_ratio = np.sqrt(ratio_moments.variance)
+            skewness_ratio = ratio_moments.skewness
+            kurt_ratio = ratio_moments.kurtosis
+
+            # Calculate statistical significance from 1:1 ratio
+            # H0: mean ratio = 1.0 (ideal stoichiometric ratio)
+            t_stat, p_value = stats.ttest_1samp(ni_ti_ratio, 1.0)
+
+            # Confidence interval; sem from the biased variance as in section 1
+            sem_ratio = np.sqrt(ratio_moments.variance / (n_ratio - 1))
+            conf_interval_ratio = t_critical_95(n_ratio - 1) * sem_ratio
+
+            comp_data += [
+                ["Mean Ni:Ti Ratio", f"{mean_ratio:.3f}", "Ideal ratio is 1.0"],
+                ["Median Ni:Ti Ratio", f"{median_ratio:.3f}", ""],
+                ["Std Dev of Ratio", f"{std_ratio:.3f}", ""],
+                ["95% CI for Ratio", f"({mean_ratio-conf_interval_ratio:.3f}, {mean_ratio+conf_interval_ratio:.3f})", ""],
+                ["Skewness", f"{skewness_ratio:.3f}", f"{'Right' if skewness_ratio > 0 else 'Left'}-skewed"],
+                ["Test vs. 1:1 Ratio", f"p-value: {p_value:.4f}", f"{'Significantly different' if p_value < 0.05 else 'Not significantly different'} from 1:1"],
+            ]
+        else:
+            comp_data.append(["Ni:Ti Ratio Statistics", "Skipped",
+                              f"{n_ratio} particle(s) contain Ti; at least 2 are needed"])
 
-        # Create composition statistics table
-        comp_data = [
-            ["Metric", "Value", "Interpretation"],
-            ["Mean Ni:Ti Ratio", f"{mean_ratio:.3f}", "Ideal ratio is 1.0"],
-            ["Median Ni:Ti Ratio", f"{median_ratio:.3f}", ""],
-            ["Std Dev of Ratio", f"{std_ratio:.3f}", ""],
-            ["95% CI for Ratio", f"({mean_ratio-conf_interval_ratio:.3f}, {mean_ratio+conf_interval_ratio:.3f})", ""],
-            ["Skewness", f"{skewness_ratio:.3f}", f"{'Right' if skewness_ratio > 0 else 'Left'}-skewed"],
-            ["Test vs. 1:1 Ratio", f"p-value: {p_value:.4f}", f"{'Significantly different' if p_value < 0.05 else 'Not significantly different'} from 1:1"],
-            ["Mean Ni Fraction", f"{np.mean(ni_fraction):.3f}", ""],
-            ["Mean Ti Fraction", f"{np.mean(ti_fraction)::.3f}", ""],
+        comp_data += [
+            ["Mean Ni Fraction", f"{mean_ni_fraction:.3f}", ""],
+            ["Mean Ti Fraction", f"{mean_ti_fraction:.3f}", ""],
+            ["Ti-free Particles", f"{n_ti_free}", "Ni:Ti ratio undefined; excluded from ratio statistics"],
         ]
 
-        comp_table = Table(comp_data, colWidths=[1.8*inch, 1.7*inch, 2.5*inch])
-        comp_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (2, 0), colors.lightgrey),
-            ('TEXTCOLOR', (0, 0), (2, 0), colors.black),
-            ('ALIGN', (0, 0), (2, 0), 'CENTER'),
-            ('FONTNAME', (0, 0), (2, 0), 'Helvetica-Bold'),
-            ('BOTTOMPADDING', (0, 0), (2, 0), 12),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        comp_table = LongTable(comp_data, colWidths=[1.8*inch, 1.7*inch, 2.5*inch], repeatRows=1)
+        comp_table.setStyle(HEADER_TABLE_STYLE)
         content.append(comp_table)
         content.append(Spacer(1, 0.2*inch))
 
         # Composition interpretation
-        stoichiometry_text = f"""
-        The compositional analysis of nanoparticles reveals a mean Ni:Ti ratio of {mean_ratio:.3f}, which is
-        {'significantly' if p_value < 0.05 else 'not significantly'} different from the ideal 1:1 ratio
-        (p-value: {p_value:.4f}). This {'deviation' if p_value < 0.05 else 'adherence to ideal stoichiometry'}
-        suggests {'preferential ejection or clustering of Ni atoms' if mean_ratio > 1 else 'preferential ejection or clustering of Ti atoms' if mean_ratio < 1 else 'balanced ejection of both elements'}
-        during the ablation process. The distribution of ratios shows
-        {'substantial' if std_ratio > 0.1 else 'minimal'} variation across particles.
-        """
-        content.append(Paragraph(stoichiometry_text, normal_style))
+        if n_ratio >= 2:
+            significant = p_value < 0.05
+            stoichiometry_text = f"""
+            The compositional analysis of nanoparticles reveals a mean Ni:Ti ratio of {mean_ratio:.3f}, which is
+            {'significantly' if significant else 'not significantly'} different from the ideal 1:1 ratio
+            (p-value: {p_value:.4f}). This {'deviation' if significant else 'adherence to ideal stoichiometry'}
+            suggests {'preferential ejection or clustering of Ni atoms' if mean_ratio > 1 else 'preferential ejection or clustering of Ti atoms' if mean_ratio < 1 else 'balanced ejection of both elements'}
+            during the ablation process. The distribution of ratios shows
+            {'substantial' if std_ratio > 0.1 else 'minimal'} variation across particles.
+            """
+        else:
+            stoichiometry_text = f"""
+            Only {n_ratio} of the {len(ni_counts)} nanoparticles contain Ti, so the Ni:Ti ratio distribution
+            and its comparison with the ideal 1:1 ratio are not reported. The mean Ni fraction of
+            {mean_ni_fraction:.3f} summarizes the composition instead.
+            """
+        content.append(text_paragraph(stoichiometry_text))
         content.append(Spacer(1, 0.3*inch))
 
         # Add composition scatter image
         img_path = os.path.join(FIGURE_DIR, 'composition_scatter.png')
         if os.path.exists(img_path):
-            content.append(Image(img_path, width=6*inch, height=4.8*inch))
+            content.append(report_image(img_path, 6*inch, 4.8*inch))
             content.append(Spacer(1, 0.1*inch))
-            content.append(Paragraph("Figure 2: Ni vs Ti atom distribution in nanoparticles", normal_style))
+            content.append(text_paragraph("Figure 2: Ni vs Ti atom distribution in nanoparticles"))
 
     # ==========================================================================
     # 3. ENHANCED STRUCTURAL ANALYSIS
@@ -690,63 +838,51 @@ def generate_pdf_report():
     content.append(Paragraph("3. Structural Analysis", heading1_style))
     content.append(Spacer(1, 0.2*inch))
 
-    rdf_data = load_data(RDF_FILE)
-    if rdf_data is not None and rdf_data.ndim > 1 and rdf_data.shape[1] >= 2:
-        r = rdf_data[:, 0]
-        gr = rdf_data[:, 1]
+    if results['structure'] is not None:
+        r, gr = results['structure']
 
         # Find peak locations and heights
-        peak_indices = []
-        for i in range(1, len(gr)-1):
-            if gr[i] > gr[i-1] and gr[i] > gr[i+1] and gr[i] > 1.0:
-                peak_indices.append(i)
+        peak_indices = find_rdf_peaks(gr)
 
-        # Extract peak data for table
-        peak_data = []
-        for i, idx in enumerate(peak_indices[:5]):  # Top 5 peaks
-            peak_data.append([f"Peak {i+1}", f"{r[idx]:.3f} Å", f"{gr[idx]:.3f}"])
+        # Extract peak data for table (first 5 peaks)
+        peak_data = [[f"Peak {i+1}", f"{pos:.3f} Å", f"{height:.3f}"]
+                     for i, (pos, height) in enumerate(zip(r[peak_indices[:5]], gr[peak_indices[:5]]))]
 
         if peak_data:
             peak_table_data = [["Peak Number", "Position (Å)", "g(r) Value"]] + peak_data
-            peak_table = Table(peak_table_data, colWidths=[2*inch, 2*inch, 2*inch])
-            peak_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (2, 0), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (2, 0), colors.black),
-                ('ALIGN', (0, 0), (2, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (2, 0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0, 0), (2, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+            peak_table = LongTable(peak_table_data, colWidths=[2*inch, 2*inch, 2*inch], repeatRows=1)
+            peak_table.setStyle(HEADER_TABLE_STYLE)
             content.append(peak_table)
             content.append(Spacer(1, 0.2*inch))
 
         # Interpret structure based on peak data
         if peak_data:
-            first_peak = r[peak_indices[0]] if peak_indices else 0
+            first_peak = r[peak_indices[0]]
             expected_nitinol_peak = 2.55  # Approximate first NN distance in NiTi
+            matches_bulk = abs(first_peak - expected_nitinol_peak) < 0.2
+            ordered = len(peak_indices) >= 3
 
             structure_text = f"""
             The radial distribution function (RDF) analysis shows the first major peak at {first_peak:.3f} Å, which
-            {'closely matches' if abs(first_peak - expected_nitinol_peak) < 0.2 else 'differs from'} the expected
+            {'closely matches' if matches_bulk else 'differs from'} the expected
             first-neighbor distance in crystalline nitinol ({expected_nitinol_peak} Å). This suggests that the
-            nanoparticles {'maintain' if abs(first_peak - expected_nitinol_peak) < 0.2 else 'deviate from'} the bulk
+            nanoparticles {'maintain' if matches_bulk else 'deviate from'} the bulk
             crystal structure at the local level.
 
-            {'The presence of well-defined' if len(peak_indices) >= 3 else 'The limited number of'} secondary peaks in the
-            RDF indicates {'good crystalline order' if len(peak_indices) >= 3 else 'limited long-range order'} in the
-            formed nanoparticles, consistent with {'well-formed nanocrystals' if len(peak_indices) >= 3 else
+            {'The presence of well-defined' if ordered else 'The limited number of'} secondary peaks in the
+            RDF indicates {'good crystalline order' if ordered else 'limited long-range order'} in the
+            formed nanoparticles, consistent with {'well-formed nanocrystals' if ordered else
             'partially amorphous or highly strained nanoparticles'}.
             """
-            content.append(Paragraph(structure_text, normal_style))
+            content.append(text_paragraph(structure_text))
 
         # Add RDF image
         img_path = os.path.join(FIGURE_DIR, 'rdf_analysis.png')
         if os.path.exists(img_path):
             content.append(Spacer(1, 0.3*inch))
-            content.append(Image(img_path, width=6*inch, height=4*inch))
+            content.append(report_image(img_path, 6*inch, 4*inch))
             content.append(Spacer(1, 0.1*inch))
-            content.append(Paragraph("Figure 3: Radial distribution function with peak analysis", normal_style))
+            content.append(text_paragraph("Figure 3: Radial distribution function with peak analysis"))
 
     # ==========================================================================
     # 4. THERMODYNAMIC ANALYSIS WITH ENHANCED STATISTICS
@@ -754,78 +890,53 @@ def generate_pdf_report():
     content.append(Paragraph("4. Thermodynamic Analysis", heading1_style))
     content.append(Spacer(1, 0.2*inch))
 
-    thermo_data = None
+    # analyze_thermodynamics already parsed the file and reported why if it could not
+    thermo_data = results['thermo']
+    if thermo_data is None and os.path.exists(THERMO_FILE):
+        content.append(text_paragraph(f"Error processing thermodynamic data: could not read {THERMO_FILE}"))
     try:
-        if os.path.exists(THERMO_FILE):
-            with open(THERMO_FILE, 'r') as f:
-                lines = f.readlines()
-
+        if thermo_data is not None:
             # Extract key values
-            energy_total = None
-            energy_nano = None
-            formation_energy = None
-            surface_energy = None
-
-            for line in lines:
-                if "Energy_Total:" in line:
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == "Energy_Total:":
-                            energy_total = float(parts[i+1])
-                        elif part == "Energy_Nano:":
-                            energy_nano = float(parts[i+1])
-                        elif part == "Formation_Energy:":
-                            formation_energy = float(parts[i+1])
-                        elif part == "Surface_Energy:":
-                            surface_energy = float(parts[i+1])
-
-            if energy_total is not None:
-                # Create energy analysis table
-                energy_data = [
-                    ["Energy Metric", "Value", "Interpretation"],
-                    ["Total System Energy", f"{energy_total:.2f} eV", "Total energy of the simulated system"],
-                    ["Nanoparticle Energy", f"{energy_nano:.2f} eV", f"{100*energy_nano/energy_total:.1f}% of total system energy"],
-                    ["Formation Energy", f"{formation_energy:.4f} eV/atom", "Energy per atom in nanoparticles"],
-                    ["Surface Energy", f"{surface_energy:.6f} eV/Å²", "Energy per unit area of nanoparticle surface"]
-                ]
-
-                energy_table = Table(energy_data, colWidths=[2*inch, 2*inch, 2*inch])
-                energy_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (2, 0), colors.lightgrey),
-                    ('TEXTCOLOR', (0, 0), (2, 0), colors.black),
-                    ('ALIGN', (0, 0), (2, 0), 'CENTER'),
-                    ('FONTNAME', (0, 0), (2, 0), 'Helvetica-Bold'),
-                    ('BOTTOMPADDING', (0, 0), (2, 0), 12),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                content.append(energy_table)
-                content.append(Spacer(1, 0.2*inch))
-
-                # Thermodynamic interpretation
-                thermo_text = f"""
-                The thermodynamic analysis reveals a formation energy of {formation_energy:.4f} eV/atom for the nitinol
-                nanoparticles, {'indicating a stable configuration' if formation_energy < 0 else 'suggesting metastable particles'}.
-                The surface energy of {surface_energy:.6f} eV/Å² is
-                {'comparable to' if 0.05 < surface_energy < 0.2 else 'different from'} typical values for metal nanoparticles,
-                which helps explain their {'tendency to form spherical structures' if surface_energy > 0.1 else
-                'morphological diversity'}.
-
-                The nanoparticle energy accounts for {100*energy_nano/energy_total:.1f}% of the total system energy,
-                indicating that {'a significant portion' if energy_nano/energy_total > 0.3 else 'only a small fraction'}
-                of the system's energy is contained in the formed nanoparticles.
-                """
-                content.append(Paragraph(thermo_text, normal_style))
+            energy_total, energy_nano, formation_energy, surface_energy = thermo_data
+
+            # Create energy analysis table
+            energy_data = [
+                ["Energy Metric", "Value", "Interpretation"],
+                ["Total System Energy", f"{energy_total:.2f} eV", "Total energy of the simulated system"],
+                ["Nanoparticle Energy", f"{energy_nano:.2f} eV", f"{100*energy_nano/energy_total:.1f}% of total system energy"],
+                ["Formation Energy", f"{formation_energy:.4f} eV/atom", "Energy per atom in nanoparticles"],
+                ["Surface Energy", f"{surface_energy:.6f} eV/Å²", "Energy per unit area of nanoparticle surface"]
+            ]
+
+            energy_table = LongTable(energy_data, colWidths=[2*inch, 2*inch, 2*inch], repeatRows=1)
+            energy_table.setStyle(HEADER_TABLE_STYLE)
+            content.append(energy_table)
+            content.append(Spacer(1, 0.2*inch))
+
+            # Thermodynamic interpretation
+            thermo_text = f"""
+            The thermodynamic analysis reveals a formation energy of {formation_energy:.4f} eV/atom for the nitinol
+            nanoparticles, {'indicating a stable configuration' if formation_energy < 0 else 'suggesting metastable particles'}.
+            The surface energy of {surface_energy:.6f} eV/Å² is
+            {'comparable to' if 0.05 < surface_energy < 0.2 else 'different from'} typical values for metal nanoparticles,
+            which helps explain their {'tendency to form spherical structures' if surface_energy > 0.1 else
+            'morphological diversity'}.
+
+            The nanoparticle energy accounts for {100*energy_nano/energy_total:.1f}% of the total system energy,
+            indicating that {'a significant portion' if energy_nano/energy_total > 0.3 else 'only a small fraction'}
+            of the system's energy is contained in the formed nanoparticles.
+            """
+            content.append(text_paragraph(thermo_text))
     except Exception as e:
-        content.append(Paragraph(f"Error processing thermodynamic data: {str(e)}", normal_style))
+        content.append(text_paragraph(f"Error processing thermodynamic data: {str(e)}"))
 
     # Add energy metrics image
     img_path = os.path.join(FIGURE_DIR, 'energy_metrics.png')
     if os.path.exists(img_path):
         content.append(Spacer(1, 0.3*inch))
-        content.append(Image(img_path, width=6*inch, height=3*inch))
+        content.append(report_image(img_path, 6*inch, 3*inch))
         content.append(Spacer(1, 0.1*inch))
-        content.append(Paragraph("Figure 4: Key energy metrics for nanoparticle formation", normal_style))
+        content.append(text_paragraph("Figure 4: Key energy metrics for nanoparticle formation"))
 
     # ==========================================================================
     # 5. TEMPORAL EVOLUTION WITH ENHANCED STATISTICS
@@ -833,12 +944,8 @@ def generate_pdf_report():
     content.append(Paragraph("5. Time Evolution Analysis", heading1_style))
     content.append(Spacer(1, 0.2*inch))
 
-    evolution_data = load_data(EVOLUTION_FILE)
-    if evolution_data is not None and evolution_data.ndim > 1 and evolution_data.shape[1] >= 4:
-        time = evolution_data[:, 0]
-        ejected_count = evolution_data[:, 1]
-        temp = evolution_data[:, 2]
-        num_clusters = evolution_data[:, 3]
+    if results['evolution'] is not None:
+        time, ejected_count, temp, num_clusters = results['evolution']
 
         # Calculate growth rates and statistics
         if len(time) > 1:
@@ -847,13 +954,11 @@ def generate_pdf_report():
             cluster_growth_rate = (num_clusters[-1] - num_clusters[0]) / time_range
             cooling_rate = (temp[-1] - temp[0]) / time_range
 
-            # Find time to reach specific thresholds
-            if max(ejected_count) > 0:
-                half_ejection_time = None
-                for i in range(len(time)):
-                    if ejected_count[i] >= max(ejected_count) * 0.5:
-                        half_ejection_time = time[i]
-                        break
+            # Find time to reach specific thresholds (first sample at or above half the peak)
+            max_ejected = ejected_count.max()
+            half_ejection_time = None
+            if max_ejected > 0:
+                half_ejection_time = time[np.argmax(ejected_count >= max_ejected * 0.5)]
 
             # Find time to reach max clusters
             max_cluster_time = time[np.argmax(num_clusters)]
@@ -868,57 +973,43 @@ def generate_pdf_report():
                 ["Time to Max Clusters", f"{max_cluster_time:.1f}", "ps"]
             ]
 
-            evol_table = Table(evolution_stats, colWidths=[2.5*inch, 2*inch, 1.5*inch])
-            evol_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (2, 0), colors.lightgrey),
-                ('TEXTCOLOR', (0, 0), (2, 0), colors.black),
-                ('ALIGN', (0, 0), (2, 0), 'CENTER'),
-                ('FONTNAME', (0, 0), (2, 0), 'Helvetica-Bold'),
-                ('BOTTOMPADDING', (0, 0), (2, 0), 12),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+            evol_table = LongTable(evolution_stats, colWidths=[2.5*inch, 2*inch, 1.5*inch], repeatRows=1)
+            evol_table.setStyle(HEADER_TABLE_STYLE)
             content.append(evol_table)
             content.append(Spacer(1, 0.2*inch))
 
             # Correlation analysis
-            data = np.column_stack((ejected_count, temp, num_clusters))
-            cols = ['Ejected Atoms', 'Temperature', 'Num Clusters']
-            corr_df = pd.DataFrame(data, columns=cols)
-            corr_matrix = corr_df.corr()
+            corr_matrix = np.corrcoef(np.stack((ejected_count, temp, num_clusters)))
 
             corr_text = f"""
             The correlation analysis between key process variables reveals:
 
-            - Ejected Atoms vs Temperature: {corr_matrix.iloc[0,1]:.3f} correlation coefficient
-              {'Strong' if abs(corr_matrix.iloc[0,1]) > 0.7 else 'Moderate' if abs(corr_matrix.iloc[0,1]) > 0.3 else 'Weak'}
-              {'positive' if corr_matrix.iloc[0,1] > 0 else 'negative'} correlation
+            - Ejected Atoms vs Temperature: {corr_matrix[0,1]:.3f} correlation coefficient
+              {correlation_strength(corr_matrix[0,1])} correlation
 
-            - Ejected Atoms vs Number of Clusters: {corr_matrix.iloc[0,2]:.3f} correlation coefficient
-              {'Strong' if abs(corr_matrix.iloc[0,2]) > 0.7 else 'Moderate' if abs(corr_matrix.iloc[0,2]) > 0.3 else 'Weak'}
-              {'positive' if corr_matrix.iloc[0,2] > 0 else 'negative'} correlation
+            - Ejected Atoms vs Number of Clusters: {corr_matrix[0,2]:.3f} correlation coefficient
+              {correlation_strength(corr_matrix[0,2])} correlation
 
-            - Temperature vs Number of Clusters: {corr_matrix.iloc[1,2]:.3f} correlation coefficient
-              {'Strong' if abs(corr_matrix.iloc[1,2]) > 0.7 else 'Moderate' if abs(corr_matrix.iloc[1,2]) > 0.3 else 'Weak'}
-              {'positive' if corr_matrix.iloc[1,2] > 0 else 'negative'} correlation
+            - Temperature vs Number of Clusters: {corr_matrix[1,2]:.3f} correlation coefficient
+              {correlation_strength(corr_matrix[1,2])} correlation
 
             This indicates that {
-            'higher temperatures strongly correlate with increased material ejection' if corr_matrix.iloc[0,1] > 0.7 else
-            'temperature has limited direct impact on material ejection' if abs(corr_matrix.iloc[0,1]) < 0.3 else
+            'higher temperatures strongly correlate with increased material ejection' if corr_matrix[0,1] > 0.7 else
+            'temperature has limited direct impact on material ejection' if abs(corr_matrix[0,1]) < 0.3 else
             'temperature moderately influences material ejection'}, and
-            {'cluster formation is primarily driven by the amount of ejected material' if corr_matrix.iloc[0,2] > 0.7 else
-            'cluster formation shows complex dependence beyond just material availability' if abs(corr_matrix.iloc[0,2]) < 0.3 else
+            {'cluster formation is primarily driven by the amount of ejected material' if corr_matrix[0,2] > 0.7 else
+            'cluster formation shows complex dependence beyond just material availability' if abs(corr_matrix[0,2]) < 0.3 else
             'material ejection has some influence on cluster formation'}.
             """
-            content.append(Paragraph(corr_text, normal_style))
+            content.append(text_paragraph(corr_text))
 
     # Add time evolution image
     img_path = os.path.join(FIGURE_DIR, 'time_evolution.png')
     if os.path.exists(img_path):
         content.append(Spacer(1, 0.3*inch))
-        content.append(Image(img_path, width=6*inch, height=7.2*inch))
+        content.append(report_image(img_path, 6*inch, 7.2*inch))
         content.append(Spacer(1, 0.1*inch))
-        content.append(Paragraph("Figure 5: Time evolution of key process variables", normal_style))
+        content.append(text_paragraph("Figure 5: Time evolution of key process variables"))
 
     # ==========================================================================
     # 6. CONCLUSIONS AND IMPLICATIONS
@@ -941,7 +1032,7 @@ def generate_pdf_report():
 
     These findings have important implications for controlling nanoparticle synthesis through microEDM processes. By manipulating process parameters such as energy input and cooling rates, it may be possible to tailor the size distribution, composition, and structural properties of the resulting nanoparticles for specific applications.
     """
-    content.append(Paragraph(conclusion_text, normal_style))
+    content.append(text_paragraph(conclusion_text))
 
     # Build PDF
     doc.build(content)
@@ -951,21 +1042,32 @@ def generate_pdf_report():
 # MAIN EXECUTION
 # =============================================================================
 
+# Each module reads its own data file, writes its own figures and returns the data the
+# PDF report needs
+ANALYSES = {
+    'size': analyze_size_distribution,
+    'composition': analyze_composition,
+    'structure': analyze_structure,
+    'thermo': analyze_thermodynamics,
+    'evolution': analyze_time_evolution,
+}
+
 def main():
     print("="*80)
     print("NITINOL NANOPARTICLE FORMATION ANALYSIS")
     print("="*80)
 
-    # Run all analysis modules
-    size_data = analyze_size_distribution()
-    composition_data = analyze_composition()
-    structure_data = analyze_structure()
-    thermo_data = analyze_thermodynamics()
-    evolution_data = analyze_time_evolution()
+    # Start from fresh reads in case main() is called again in the same process
+    _read_data.cache_clear()
+
+    # Run all analysis modules, independent of each other, in parallel processes
+    with ProcessPoolExecutor(max_workers=min(len(ANALYSES), os.cpu_count() or 1)) as executor:
+        futures = {name: executor.submit(analysis) for name, analysis in ANALYSES.items()}
+        results = {name: future.result() for name, future in futures.items()}
 
     # Generate reports
     generate_report()  # Original HTML report
-    generate_pdf_report()  # New enhanced PDF report
+    generate_pdf_report(results)  # New enhanced PDF report
 
     print("\nAnalysis complete. Results saved to:", FIGURE_DIR)
     print("PDF report with enhanced statistics generated in:", DATA_DIR)
@@ -1,51 +1,65 @@
 # Test Python environment and packages
-import numpy as np
-import matplotlib.pyplot as plt
-import ase
-import ovito
-import freud
-import pandas as pd
-import scipy
-
-print("Python environment test:")
-print(f"NumPy version: {np.__version__}")
-print(f"ASE version: {ase.__version__}")
-
-# OVITO uses a different method to get version
-try:
-    from ovito import version
-    print(f"OVITO version: {version.ovito_version}")
-except (ImportError, AttributeError):
-    print("OVITO version: Unable to determine version")
-
-print(f"Freud version: {freud.__version__}")
-print(f"Pandas version: {pd.__version__}")
-print(f"SciPy version: {scipy.__version__}")
-
-# Try to detect GPU
-try:
-    import torch
-    print(f"PyTorch version: {torch.__version__}")
-    print(f"CUDA available: {torch.cuda.is_available()}")
-    if torch.cuda.is_available():
-        print(f"CUDA device: {torch.cuda.get_device_name(0)}")
-except ImportError:
-    print("PyTorch not installed")
-
-print("\nEnvironment test completed successfully!")
+# Run this file directly. The package imports load large native libraries (OVITO, freud,
+# PyTorch, CuPy), so they only happen when the checks run, not when the file is imported
+# (pytest collects *_test.py files)
+import importlib.metadata
+
+
+def check_environment():
+    import numpy as np
+    import ase
+    import ovito
+    import freud
+    import pandas as pd
+    import scipy
+
+    print("Python environment test:")
+    print(f"NumPy version: {np.__version__}")
+    print(f"ASE version: {ase.__version__}")
+
+    # OVITO uses a different method to get version
+    try:
+        from ovito import version
+        print(f"OVITO version: {version.ovito_version}")
+    except (ImportError, AttributeError):
+        print("OVITO version: Unable to determine version")
+
+    print(f"Freud version: {freud.__version__}")
+    print(f"Pandas version: {pd.__version__}")
+    print(f"SciPy version: {scipy.__version__}")
+
+    # Try to detect GPU; the version comes from the package metadata, so a missing
+    # PyTorch is reported without importing it
+    try:
+        print(f"PyTorch version: {importlib.metadata.version('torch')}")
+    except importlib.metadata.PackageNotFoundError:
+        print("PyTorch not installed")
+    else:
+        import torch
+        print(f"CUDA available: {torch.cuda.is_available()}")
+        if torch.cuda.is_available():
+            print(f"CUDA device: {torch.cuda.get_device_name(0)}")
+
+    print("\nEnvironment test completed successfully!")
 
 #----------------------------------------------------------------
 
-import cupy as cp
+def check_cupy():
+    import cupy as cp
+
+    # Print CUDA version
+    print("CUDA version:", cp.cuda.runtime.runtimeGetVersion())
+
+    # Test array creation and operation
+    x = cp.array([1, 2, 3])
+    print("CuPy array:", x)
+    print("Array squared:", x**2)
 
-# Print CUDA version
-print("CUDA version:", cp.cuda.runtime.runtimeGetVersion())
+    # Test GPU memory usage
+    print("Memory usage:")
+    print(cp.cuda.runtime.memGetInfo())
 
-# Test array creation and operation
-x = cp.array([1, 2, 3])
-print("CuPy array:", x)
-print("Array squared:", x**2)
 
-# Test GPU memory usage
-print("Memory usage:")
-print(cp.cuda.runtime.memGetInfo())
+if __name__ == "__main__":
+    check_environment()
+    check_cupy()